@@ -0,0 +1,154 @@
+"""
+Micro-benchmark: template context build (DotDict legado vs TemplateView).
+
+Uso (a partir de packages/ai):
+    PYTHONPATH=src python benchmarks/template_context_bench.py [--experiences N] [--number N]
+
+Mede quantos objetos cíclicos cada construção deixa para o coletor de lixo
+(a diferença que motivou a troca) e, como referência, o tempo de construção
+isolada e de construção + render do template default/pt. Os tempos das duas
+versões ficam dentro do ruído entre execuções e não indicam ganho.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+from typing import Any
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from infrastructure.adapters.outbound.pdf.template_context import build_template_context
+from infrastructure.adapters.outbound.pdf.weasyprint_adapter import DEFAULT_TEMPLATES_DIR
+
+
+def legacy_dict_to_template_context(data: dict) -> Any:
+    # Cópia fiel de WeasyPrintAdapter._dict_to_template_context antes da troca.
+    class DotDict:
+        def __init__(self, d: dict):
+            for k, v in d.items():
+                if isinstance(v, dict):
+                    setattr(self, k, DotDict(v))
+                elif isinstance(v, list):
+                    if k == "skills" and v and isinstance(v[0], dict):
+                        if any(key in v[0] for key in ["languages", "frameworks", "tools"]):
+                            skills_dict = {}
+                            for item in v:
+                                if isinstance(item, dict):
+                                    for cat, values in item.items():
+                                        if cat not in skills_dict:
+                                            skills_dict[cat] = []
+                                        if isinstance(values, list):
+                                            skills_dict[cat].extend(values)
+                            setattr(self, k, DotDict(skills_dict))
+                        else:
+                            setattr(self, k, [DotDict(i) if isinstance(i, dict) else i for i in v])
+                    else:
+                        setattr(self, k, [DotDict(i) if isinstance(i, dict) else i for i in v])
+                else:
+                    setattr(self, k, v)
+
+        def __getattr__(self, name: str) -> Any:
+            return None
+
+    return DotDict(data)
+
+
+def build_resume(experiences: int) -> dict:
+    return {
+        "candidate_name": "Maria Souza",
+        "contact_info": {
+            "email": "maria@example.com",
+            "phone": "+55 11 99999-0000",
+            "linkedin": "https://linkedin.com/in/maria",
+            "location": "São Paulo",
+            "open_to_remote": True,
+        },
+        "professional_summary": "Engenheira de software com foco em sistemas distribuídos. " * 4,
+        "experiences": [
+            {
+                "company": f"Empresa {i}",
+                "position": "Desenvolvedora Backend",
+                "description": "Desenvolvimento de APIs e serviços de alta disponibilidade.",
+                "achievements": [f"Reduziu latência em {n}%" for n in range(6)],
+                "date_range": {
+                    "start_formatted": "01/2020",
+                    "end_formatted": "12/2022",
+                    "is_current": False,
+                },
+                "work_mode": "Remoto",
+                "country": "Brasil",
+            }
+            for i in range(experiences)
+        ],
+        "educations": [
+            {
+                "institution": "USP",
+                "degree": "Bacharelado",
+                "field_of_study": "Ciência da Computação",
+                "date_range": {"start_formatted": "2012", "end_formatted": "2016"},
+            }
+        ],
+        "skills": [
+            {"languages": ["Python", "Go", "TypeScript"]},
+            {"frameworks": ["FastAPI", "Django", "React"]},
+            {"tools": ["Docker", "Kubernetes", "PostgreSQL"]},
+        ],
+        "languages": [{"name": "Inglês", "proficiency": "Avançado"}],
+        "certifications": [{"name": "AWS SAA", "issuer": "AWS", "date": "2023"}],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--experiences", type=int, default=20)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    resume = build_resume(args.experiences)
+    env = Environment(
+        loader=FileSystemLoader(str(DEFAULT_TEMPLATES_DIR)),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+    template = env.get_template("default/pt/template.html")
+
+    legacy_html = template.render(resume=legacy_dict_to_template_context(resume))
+    view_html = template.render(resume=build_template_context(resume))
+    assert legacy_html == view_html, "TemplateView output differs from legacy DotDict"
+
+    cases = {
+        "build (legacy DotDict)": lambda: legacy_dict_to_template_context(resume),
+        "build (TemplateView)": lambda: build_template_context(resume),
+        "build+render (legacy DotDict)": lambda: template.render(
+            resume=legacy_dict_to_template_context(resume)
+        ),
+        "build+render (TemplateView)": lambda: template.render(
+            resume=build_template_context(resume)
+        ),
+    }
+
+    print(f"experiences={args.experiences} number={args.number}")
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+        print(f"{name:<32} {best * 1e6:10.2f} µs/op")
+
+    builders = {
+        "legacy DotDict": legacy_dict_to_template_context,
+        "TemplateView": build_template_context,
+    }
+    for name, build in builders.items():
+        gc.collect()
+        gc.disable()
+        try:
+            before = len(gc.get_objects())
+            for _ in range(100):
+                build(resume)
+            leftover = (len(gc.get_objects()) - before) / 100
+        finally:
+            gc.enable()
+        print(f"cyclic garbage ({name}){'':<{15 - len(name)}} {leftover:10.1f} objs/op")
+
+
+if __name__ == "__main__":
+    main()
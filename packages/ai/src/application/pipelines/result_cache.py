@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from domain.chains.compatibility_chain import CompatibilityResult
+from domain.chains.creative_builder_chain import CreativeResult
+from domain.chains.optimization_chain import OptimizationResult
+from domain.ports.outbound.cache_port import CachePort
+from domain.ports.outbound.pdf_renderer_port import PDFRenderRequest
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pipeline"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+@dataclass
+class CachedPipelineRun:
+    mode: str
+    compatibility: CompatibilityResult
+    optimization: Union[OptimizationResult, CreativeResult]
+    pdf_request: Optional[PDFRenderRequest] = None
+
+
+class PipelineResultCache:
+    """
+    Resultado de execuções completas do ResumePipeline.
+
+    A chave combina currículo e vaga normalizados com as versões dos prompts
+    e o modelo: mudar qualquer um deles invalida as entradas antigas. O PDF
+    não é guardado, e sim o request de renderização já traduzido, que é
+    reenviado ao renderer (que tem cache próprio por conteúdo).
+    """
+
+    def __init__(self, cache: CachePort, ttl_seconds: int = 86_400) -> None:
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds
+
+    def build_key(
+        self,
+        resume_content: str,
+        job_description: str,
+        model: str,
+        prompt_versions: dict[str, str],
+    ) -> str:
+        payload = json.dumps(
+            {
+                "resume": _normalize(resume_content),
+                "job": _normalize(job_description),
+                "model": model,
+                "prompts": prompt_versions,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return f"{KEY_PREFIX}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    async def get(self, key: str) -> Optional[CachedPipelineRun]:
+        try:
+            data = await self._cache.get(key)
+            if data is None:
+                return None
+
+            optimization_type = CreativeResult if data["mode"] == "creative" else OptimizationResult
+            pdf_request = data.get("pdf_request")
+            return CachedPipelineRun(
+                mode=data["mode"],
+                compatibility=CompatibilityResult(**data["compatibility"]),
+                optimization=optimization_type(**data["optimization"]),
+                pdf_request=PDFRenderRequest(**pdf_request) if pdf_request else None,
+            )
+        except Exception as e:
+            logger.warning(f"Pipeline cache read failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, run: CachedPipelineRun) -> None:
+        pdf_request = None
+        if run.pdf_request is not None:
+            pdf_request = {
+                "resume": run.pdf_request.resume,
+                "template_id": run.pdf_request.template_id,
+                "language": run.pdf_request.language,
+            }
+
+        try:
+            await self._cache.set(
+                key,
+                {
+                    "mode": run.mode,
+                    "compatibility": run.compatibility.model_dump(),
+                    "optimization": run.optimization.model_dump(),
+                    "pdf_request": pdf_request,
+                },
+                ttl_seconds=self._ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Pipeline cache write failed for {key}: {e}")
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
 
 from domain.chains import (
     CompatibilityChain, 
     OptimizationChain, 
     CreativeBuilderChain,
+    JobAnalysis,
+    JobAnalysisChain,
     PDFChain,
 )
 from domain.chains.compatibility_chain import CompatibilityResult
 from domain.chains.optimization_chain import OptimizationResult, OptimizedResume
 from domain.chains.creative_builder_chain import CreativeResult
+from domain.ports.outbound.pdf_renderer_port import PDFRenderRequest
+from application.pipelines.result_cache import CachedPipelineRun, PipelineResultCache
+from application.pipelines.stage_graph import Stage, StageFailedError, StageGraph
+from application.services.language_service import Language, LanguageService
 
 logger = logging.getLogger(__name__)
 
@@ -25,26 +31,238 @@ class PipelineResult:
     compatibility: Optional[CompatibilityResult] = None
     optimization: Optional[Union[OptimizationResult, CreativeResult]] = None
     mode: str = "standard"
+    timings: dict[str, float] = field(default_factory=dict)
+    cached: bool = False
+
+
+@dataclass
+class _Optimized:
+    result: Union[OptimizationResult, CreativeResult]
+    resume: OptimizedResume
+    mode: str
+
+
+@dataclass
+class _RenderedPDF:
+    request: Optional[PDFRenderRequest]
+    url: Optional[str]
+    # Só execuções completas (PDF montado e traduzido) vão para o cache.
+    cacheable: bool
 
 
 class ResumePipeline:
+    """
+    Etapas do pipeline como um grafo de dependências:
+
+        language ──► pdf_warmup ─────────────────────────────┐
+                                                             ▼
+        job_analysis ──► compatibility ──► optimization ──► pdf
+
+    Tudo que não depende da análise de compatibilidade roda junto com ela.
+
+    Com on_event, run() emite eventos de progresso (dicts com "event"):
+    stage ao fim de cada etapa, compatibility com o resultado da análise,
+    token com os trechos da otimização conforme o LLM gera e pdf_ready.
+    Os tokens são a saída bruta do modelo (JSON parcial), só para mostrar
+    progresso: o resultado estruturado chega no evento final.
+
+    Com result_cache, execuções bem-sucedidas são reaproveitadas para a
+    mesma entrada; bypass_cache força uma nova geração (e atualiza o cache).
+    """
+
     def __init__(
         self,
         compatibility_chain: CompatibilityChain,
         optimization_chain: OptimizationChain,
         creative_chain: CreativeBuilderChain,
         pdf_chain: PDFChain,
+        language_service: Optional[LanguageService] = None,
+        result_cache: Optional[PipelineResultCache] = None,
+        model_name: str = "",
+        job_analysis_chain: Optional[JobAnalysisChain] = None,
     ):
         self._compatibility = compatibility_chain
         self._optimization = optimization_chain
         self._creative = creative_chain
         self._pdf = pdf_chain
+        self._language_service = language_service
+        self._result_cache = result_cache
+        self._model_name = model_name
+        self._job_analysis = job_analysis_chain
 
     async def run(
-        self, resume_content: str, job_description: str
+        self,
+        resume_content: str,
+        job_description: str,
+        on_event: Optional[Callable[[dict], None]] = None,
+        bypass_cache: bool = False,
     ) -> PipelineResult:
-        compatibility = await self._compatibility.run(resume_content, job_description)
+        emit = on_event or (lambda event: None)
+
+        cache_key = None
+        if self._result_cache:
+            cache_key = self._result_cache.build_key(
+                resume_content,
+                job_description,
+                self._model_name,
+                {
+                    "compatibility": self._compatibility.prompt_version,
+                    "optimization": self._optimization.prompt_version,
+                    "creative_builder": self._creative.prompt_version,
+                    "job_analysis": (
+                        self._job_analysis.prompt_version if self._job_analysis else ""
+                    ),
+                },
+            )
+            cached = None if bypass_cache else await self._result_cache.get(cache_key)
+            if cached is not None:
+                return await self._from_cache(cached, emit)
+
+        on_token = (lambda text: emit({"event": "token", "content": text})) if on_event else None
+
+        async def detect_language() -> Language:
+            if not self._language_service:
+                return "pt"
+            return self._language_service.detect_language(job_description)
+
+        async def warm_up_pdf(language: Language) -> None:
+            await self._pdf.prepare(language)
+
+        async def lookup_job_analysis() -> Optional[JobAnalysis]:
+            if not self._job_analysis:
+                return None
+            return await self._job_analysis.lookup(job_description)
+
+        async def analyze_compatibility(job_analysis: Optional[JobAnalysis]) -> CompatibilityResult:
+            compatibility = await self._compatibility.run(
+                resume_content, job_description, job_analysis=job_analysis
+            )
+            self._log_compatibility(compatibility)
+            return compatibility
+
+        async def optimize(compatibility: CompatibilityResult) -> _Optimized:
+            if compatibility.needs_creative_mode:
+                return await self._run_creative_mode(
+                    resume_content, job_description, compatibility, on_token
+                )
+            return await self._run_standard_mode(
+                resume_content, job_description, compatibility, on_token
+            )
+
+        async def render_pdf(
+            optimization: _Optimized,
+            language: Language,
+        ) -> _RenderedPDF:
+            prepared = await self._pdf.build_request(
+                optimization.resume, job_description, target_language=language
+            )
+            if prepared is None:
+                return _RenderedPDF(None, None, cacheable=not self._pdf.enabled)
+            url = await self._pdf.render(prepared.request)
+            return _RenderedPDF(prepared.request, url, cacheable=prepared.complete)
+
+        graph = StageGraph(
+            [
+                Stage("language", detect_language),
+                Stage("pdf_warmup", warm_up_pdf, depends_on=("language",), optional=True),
+                Stage("job_analysis", lookup_job_analysis, optional=True),
+                Stage("compatibility", analyze_compatibility, depends_on=("job_analysis",)),
+                Stage("optimization", optimize, depends_on=("compatibility",)),
+                Stage(
+                    "pdf",
+                    render_pdf,
+                    depends_on=("optimization", "language"),
+                    after=("pdf_warmup",),
+                ),
+            ]
+        )
+
+        def on_stage_complete(stage: str, result: Any, elapsed_ms: float) -> None:
+            emit({"event": "stage", "stage": stage, "elapsed_ms": elapsed_ms})
+            if stage == "compatibility":
+                emit(
+                    {
+                        "event": "compatibility",
+                        "compatibility_score": result.compatibility_score,
+                        "candidate_area": result.candidate_area,
+                        "job_area": result.job_area,
+                        "requires_career_pivot": result.requires_career_pivot,
+                        "needs_creative_mode": result.needs_creative_mode,
+                    }
+                )
+            elif stage == "pdf":
+                emit({"event": "pdf_ready", "pdf_url": result.url})
+
+        try:
+            run = await graph.run(on_stage_complete)
+        except StageFailedError as e:
+            if e.stage == "compatibility":
+                raise e.__cause__ from e
+            logger.error(f"Pipeline failed at {e.stage}: {e.__cause__} (timings ms: {e.run.timings})")
+            return PipelineResult(
+                success=False,
+                content="Ocorreu um erro ao otimizar o currículo. Por favor, tente novamente.",
+                compatibility=e.run.results.get("compatibility"),
+                timings=e.run.timings,
+            )
+
+        logger.info(f"Pipeline stage timings (ms): {run.timings}")
+
+        compatibility = run.results["compatibility"]
+        optimized: _Optimized = run.results["optimization"]
+        rendered: _RenderedPDF = run.results["pdf"]
+        pdf_url = rendered.url
+
+        if cache_key and rendered.cacheable:
+            await self._result_cache.set(
+                cache_key,
+                CachedPipelineRun(optimized.mode, compatibility, optimized.result, rendered.request),
+            )
 
+        if optimized.mode == "creative":
+            content = self._format_creative_success(optimized.result, pdf_url, compatibility)
+        else:
+            content = self._format_success(optimized.result, pdf_url, compatibility)
+
+        return PipelineResult(
+            success=True,
+            content=content,
+            pdf_url=pdf_url,
+            compatibility=compatibility,
+            optimization=optimized.result,
+            mode=optimized.mode,
+            timings=run.timings,
+        )
+
+    async def _from_cache(
+        self, cached: CachedPipelineRun, emit: Callable[[dict], None]
+    ) -> PipelineResult:
+        logger.info(f"Pipeline cache hit (mode: {cached.mode})")
+        emit({"event": "cache_hit", "mode": cached.mode})
+
+        # O arquivo pode ter sido removido pelo sweeper: o renderer reaproveita
+        # o PDF se ainda existir ou o gera de novo, sem chamadas ao LLM.
+        pdf_url = None
+        if cached.pdf_request is not None:
+            pdf_url = await self._pdf.render(cached.pdf_request)
+            emit({"event": "pdf_ready", "pdf_url": pdf_url})
+
+        if cached.mode == "creative":
+            content = self._format_creative_success(cached.optimization, pdf_url, cached.compatibility)
+        else:
+            content = self._format_success(cached.optimization, pdf_url, cached.compatibility)
+
+        return PipelineResult(
+            success=True,
+            content=content,
+            pdf_url=pdf_url,
+            compatibility=cached.compatibility,
+            optimization=cached.optimization,
+            mode=cached.mode,
+            cached=True,
+        )
+
+    def _log_compatibility(self, compatibility: CompatibilityResult) -> None:
         # Log detalhado da análise de compatibilidade
         logger.info("=" * 60)
         logger.info("ANÁLISE DE COMPATIBILIDADE")
@@ -60,29 +278,13 @@ class ResumePipeline:
         logger.info(f"Razão: {compatibility.reason}")
         logger.info("=" * 60)
 
-        try:
-            if compatibility.needs_creative_mode:
-                return await self._run_creative_mode(
-                    resume_content, job_description, compatibility
-                )
-            else:
-                return await self._run_standard_mode(
-                    resume_content, job_description, compatibility
-                )
-        except Exception as e:
-            logger.error(f"Pipeline failed: {e}")
-            return PipelineResult(
-                success=False,
-                content="Ocorreu um erro ao otimizar o currículo. Por favor, tente novamente.",
-                compatibility=compatibility,
-            )
-
     async def _run_standard_mode(
         self,
         resume_content: str,
         job_description: str,
         compatibility: CompatibilityResult,
-    ) -> PipelineResult:
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> _Optimized:
         pivot_strategy = None
         transferable_skills = None
 
@@ -100,45 +302,30 @@ class ResumePipeline:
             job_description,
             pivot_strategy=pivot_strategy,
             transferable_skills=transferable_skills,
+            on_token=on_token,
         )
-        pdf_url = await self._pdf.run(optimization.optimized_resume, job_description)
 
         mode = "pivot" if compatibility.requires_career_pivot else "standard"
-
-        return PipelineResult(
-            success=True,
-            content=self._format_success(optimization, pdf_url, compatibility),
-            pdf_url=pdf_url,
-            compatibility=compatibility,
-            optimization=optimization,
-            mode=mode,
-        )
+        return _Optimized(optimization, optimization.optimized_resume, mode)
 
     async def _run_creative_mode(
         self,
         candidate_info: str,
         job_description: str,
         compatibility: CompatibilityResult,
-    ) -> PipelineResult:
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> _Optimized:
         logger.info("Creative mode activated - building resume from scratch")
 
         creative_result = await self._creative.run(
             candidate_info,
             job_description,
             allow_fictional=compatibility.allow_fictional,
+            on_token=on_token,
         )
 
         resume_for_pdf = self._convert_creative_to_optimized(creative_result)
-        pdf_url = await self._pdf.run(resume_for_pdf, job_description)
-
-        return PipelineResult(
-            success=True,
-            content=self._format_creative_success(creative_result, pdf_url, compatibility),
-            pdf_url=pdf_url,
-            compatibility=compatibility,
-            optimization=creative_result,
-            mode="creative",
-        )
+        return _Optimized(creative_result, resume_for_pdf, "creative")
 
     def _convert_creative_to_optimized(self, creative: CreativeResult) -> OptimizedResume:
         from domain.chains.optimization_chain import OptimizedResume, OptimizedExperience
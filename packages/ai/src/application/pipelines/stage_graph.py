@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Etapa do pipeline. run recebe os resultados das dependências como
+    argumentos nomeados (nome da etapa -> resultado); etapas em after só
+    precisam terminar antes, sem passar resultado. Etapas opcionais que
+    falham viram None para quem depende delas em vez de abortar o pipeline.
+    """
+
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    optional: bool = False
+    after: tuple[str, ...] = ()
+
+
+@dataclass
+class StageRun:
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class StageFailedError(Exception):
+    def __init__(self, stage: str, run: StageRun) -> None:
+        super().__init__(f"Stage {stage} failed")
+        self.stage = stage
+        self.run = run
+
+
+class StageGraph:
+    """
+    Executa etapas em ordem de dependência, com as independentes rodando
+    em paralelo: cada etapa começa assim que suas dependências terminam.
+    Registra a duração de cada etapa em milissegundos.
+    """
+
+    def __init__(self, stages: list[Stage]) -> None:
+        self._stages = {stage.name: stage for stage in stages}
+        if len(self._stages) != len(stages):
+            raise ValueError("Duplicate stage names")
+        for stage in stages:
+            missing = {*stage.depends_on, *stage.after} - self._stages.keys()
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {missing}")
+        self._check_acyclic()
+
+    async def run(
+        self,
+        on_complete: Optional[Callable[[str, Any, float], None]] = None,
+    ) -> StageRun:
+        """on_complete(nome, resultado, ms) é chamado ao fim de cada etapa."""
+        run = StageRun()
+        tasks: dict[str, asyncio.Task] = {}
+        failed: list[str] = []
+
+        async def execute(stage: Stage) -> Any:
+            dependencies = {name: await tasks[name] for name in stage.depends_on}
+            for name in stage.after:
+                await tasks[name]
+            started = time.perf_counter()
+            try:
+                result = await stage.run(**dependencies)
+            except Exception as e:
+                if not stage.optional:
+                    failed.append(stage.name)
+                    raise
+                logger.warning(f"Optional stage {stage.name} failed: {e}")
+                result = None
+            finally:
+                run.timings[stage.name] = round((time.perf_counter() - started) * 1000, 1)
+            run.results[stage.name] = result
+            if on_complete:
+                on_complete(stage.name, result, run.timings[stage.name])
+            return result
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.ensure_future(execute(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception as e:
+            raise StageFailedError(failed[0], run) from e
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        return run
+
+    def _check_acyclic(self) -> None:
+        visited: set[str] = set()
+        visiting: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Stage dependency cycle at {name}")
+            visiting.add(name)
+            for dependency in (*self._stages[name].depends_on, *self._stages[name].after):
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._stages:
+            visit(name)
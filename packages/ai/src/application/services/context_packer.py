@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Chunks com similaridade de shingles acima disso são considerados repetidos.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+# Abaixo disso não vale a pena incluir um trecho truncado.
+MIN_TRUNCATED_TOKENS = 48
+
+_SHINGLE_SIZE = 3
+_SENTENCE_END = re.compile(r"[.!?\n]\s")
+_TRUNCATION_MARK = " […]"
+
+
+@lru_cache(maxsize=8)
+def _load_encoder(model: str) -> Optional[Any]:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Sem acesso ao arquivo BPE (ex.: ambiente offline): usa a estimativa.
+        logger.warning(f"tiktoken encoding unavailable for {model}, estimating tokens: {e}")
+        return None
+
+
+def _shingles(text: str) -> set[tuple[str, ...]]:
+    words = text.lower().split()
+    if len(words) < _SHINGLE_SIZE:
+        return {tuple(words)}
+    return {tuple(words[i : i + _SHINGLE_SIZE]) for i in range(len(words) - _SHINGLE_SIZE + 1)}
+
+
+def _similarity(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class ContextPacker:
+    """
+    Monta o bloco de contexto dos prompts dentro de um orçamento de tokens.
+
+    Conta tokens com o tiktoken do modelo (ou ~4 caracteres por token quando
+    o encoding não está disponível), descarta chunks quase idênticos a um já
+    incluído e trunca o último trecho que não cabe inteiro, de preferência em
+    fim de frase.
+
+    O encoding só é usado depois de warm_up(), que o carrega fora do event
+    loop (a primeira carga pode baixar o arquivo BPE); antes disso vale a
+    estimativa.
+    """
+
+    def __init__(self, model: str = "gpt-4o", max_tokens: int = 1500) -> None:
+        self._model = model
+        self._max_tokens = max_tokens
+        self._encoder: Optional[Any] = None
+
+    async def warm_up(self) -> None:
+        self._encoder = await asyncio.to_thread(_load_encoder, self._model)
+
+    def count_tokens(self, text: str) -> int:
+        encoder = self._encoder
+        if encoder is None:
+            return (len(text) + 3) // 4
+        return len(encoder.encode(text, disallowed_special=()))
+
+    def pack(
+        self,
+        contents: Sequence[str],
+        label: Callable[[int], str],
+        max_tokens: Optional[int] = None,
+        separator: str = "\n\n",
+    ) -> str:
+        budget = self._max_tokens if max_tokens is None else max_tokens
+        separator_tokens = self.count_tokens(separator)
+        sections: list[str] = []
+        seen: list[set] = []
+
+        for content in contents:
+            content = content.strip()
+            if not content:
+                continue
+
+            shingles = _shingles(content)
+            if any(_similarity(shingles, other) >= NEAR_DUPLICATE_THRESHOLD for other in seen):
+                continue
+
+            header = label(len(sections) + 1)
+            overhead = self.count_tokens(header) + 1 + (separator_tokens if sections else 0)
+            available = budget - overhead
+            if available < MIN_TRUNCATED_TOKENS:
+                break
+
+            if self.count_tokens(content) > available:
+                content = self._truncate(content, available)
+                sections.append(f"{header}\n{content}")
+                break
+
+            sections.append(f"{header}\n{content}")
+            seen.append(shingles)
+            budget -= overhead + self.count_tokens(content)
+
+        return separator.join(sections)
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        max_tokens -= self.count_tokens(_TRUNCATION_MARK)
+        encoder = self._encoder
+        if encoder is None:
+            cut = text[: max_tokens * 4]
+        else:
+            cut = encoder.decode(encoder.encode(text, disallowed_special=())[:max_tokens])
+
+        # Recua até o último fim de frase se ele não descartar metade do trecho.
+        boundaries = [m.end() for m in _SENTENCE_END.finditer(cut)]
+        if boundaries and boundaries[-1] > len(cut) // 2:
+            cut = cut[: boundaries[-1]]
+        return cut.rstrip() + _TRUNCATION_MARK
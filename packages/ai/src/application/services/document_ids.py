@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Optional
+from uuid import NAMESPACE_URL, uuid5
+
+from application.services.text_normalization import normalize_text
+
+# Namespace fixo: o mesmo conteúdo gera o mesmo ID em qualquer pod ou versão.
+KNOWLEDGE_NAMESPACE = uuid5(NAMESPACE_URL, "coomb:knowledge")
+
+# Campo do payload com o hash de conteúdo + metadados do ponto gravado.
+INDEX_HASH_FIELD = "index_hash"
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(normalize_text(content).encode("utf-8")).hexdigest()
+
+
+def content_document_id(content: str, source_id: Optional[str] = None) -> str:
+    """
+    ID de ponto (UUIDv5) derivado do hash do conteúdo normalizado e, quando
+    informada, da fonte: o mesmo trecho em fontes diferentes vira pontos
+    diferentes, cada um com seus metadados. Sem fonte, conteúdo igual é o
+    mesmo ponto.
+    """
+    name = content_hash(content)
+    if source_id:
+        name = f"{source_id}:{name}"
+    return str(uuid5(KNOWLEDGE_NAMESPACE, name))
+
+
+def index_hash(content: str, metadata: dict) -> str:
+    """
+    Hash do conteúdo normalizado junto com os metadados. O ID do ponto só
+    depende do conteúdo (e da fonte); este hash muda também quando os
+    metadados mudam, e é ele que decide se um documento já indexado pode
+    ser pulado.
+    """
+    payload = json.dumps(
+        {k: v for k, v in metadata.items() if k != INDEX_HASH_FIELD},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(f"{normalize_text(content)}\n{payload}".encode("utf-8")).hexdigest()
@@ -0,0 +1,130 @@
+"""Two-tier (in-process LRU + shared CachePort) cache for embedding vectors."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+from array import array
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from application.services.text_normalization import normalize_text
+from domain.ports.outbound.cache_port import CachePort
+
+logger = logging.getLogger(__name__)
+
+# v2: os vetores passaram a ir para o CachePort em base64; entradas antigas
+# (bytes crus no Redis) ficam de fora e expiram pelo TTL.
+KEY_PREFIX = "emb:v2"
+
+
+def build_embedding_key(text: str, model: str, dimension: int) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{model}:{dimension}:{digest}"
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(data: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """
+    Cache de embeddings em dois níveis: LRU no processo e, opcionalmente,
+    um CachePort compartilhado (Redis em produção) como segundo nível.
+
+    A chave combina o hash do texto normalizado com modelo e dimensão, então
+    trocar de modelo nunca reaproveita vetores antigos. Os vetores ficam em
+    float32 (4 bytes por dimensão) na memória e vão para o CachePort em
+    base64, que cabe em qualquer adapter que serializa JSON.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        shared: Optional[CachePort] = None,
+        ttl_seconds: int = 30 * 24 * 3600,
+    ) -> None:
+        self._max_entries = max_entries
+        self._shared = shared
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "memory_hits": self._memory_hits,
+            "shared_hits": self._shared_hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+        }
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        results: list[Optional[list[float]]] = [None] * len(keys)
+        remote_indexes: list[int] = []
+
+        for i, key in enumerate(keys):
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+                results[i] = unpack_vector(data)
+            else:
+                remote_indexes.append(i)
+
+        if remote_indexes and self._shared is not None:
+            try:
+                values = await self._shared.get_many([keys[i] for i in remote_indexes])
+            except Exception as e:
+                logger.warning(f"Embedding cache shared tier read failed: {e}")
+                values = [None] * len(remote_indexes)
+
+            for i, value in zip(remote_indexes, values):
+                data = _decode(value)
+                if data is not None:
+                    self._shared_hits += 1
+                    self._remember(keys[i], data)
+                    results[i] = unpack_vector(data)
+
+        self._misses += sum(1 for r in results if r is None)
+        return results
+
+    async def set_many(self, items: Sequence[tuple[str, Sequence[float]]]) -> None:
+        packed = [(key, pack_vector(vector)) for key, vector in items]
+        for key, data in packed:
+            self._remember(key, data)
+
+        if not packed or self._shared is None:
+            return
+
+        try:
+            await self._shared.set_many(
+                {key: base64.b64encode(data).decode("ascii") for key, data in packed},
+                ttl_seconds=self._ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache shared tier write failed: {e}")
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _decode(value: Any) -> Optional[bytes]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return base64.b64decode(value, validate=True)
+    except ValueError:
+        return None
@@ -1,67 +1,143 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from typing import Optional
 
-from openai import AsyncOpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
 
+from application.services.embedding_cache import EmbeddingCache, build_embedding_key
+from application.services.micro_batcher import MicroBatcher
+from application.services.text_normalization import normalize_text
 from infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Teto para o Retry-After do servidor e para o backoff exponencial.
+MAX_RETRY_DELAY_SECONDS = 20.0
+
 
 class EmbeddingService:
-    def __init__(self):
+    def __init__(self, cache: Optional[EmbeddingCache] = None):
         settings = get_settings()
+        # Retries ficam aqui (com backoff e semáforo), não no client.
         self._client = (
-            AsyncOpenAI(api_key=settings.openai_api_key)
+            AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
             if settings.openai_api_key
             else None
         )
         self._model = "text-embedding-3-small"
         self._dimension = 1536
+        self._cache = cache
+        self._batch_size = settings.embedding_max_batch_size
+        self._max_retries = settings.embedding_max_retries
+        self._semaphore = asyncio.Semaphore(settings.embedding_max_concurrency)
+        self._batcher: MicroBatcher[str, list[float]] = MicroBatcher(
+            self.embed_batch,
+            max_batch_size=self._batch_size,
+            max_wait_seconds=settings.embedding_batch_window_ms / 1000,
+            # 400 costuma ser um texto inválido: isola o item em vez de falhar o lote.
+            split_on=(BadRequestError,),
+        )
 
     async def embed_text(self, text: str) -> list[float]:
+        # Chamadas concorrentes de requests diferentes viram uma só chamada à API.
+        return await self._batcher.submit(text)
+
+    async def embed_batch(
+        self, texts: list[str], batch_size: Optional[int] = None
+    ) -> list[list[float]]:
         if not self._client:
             raise RuntimeError("OpenAI API key not configured")
 
-        try:
-            response = await self._client.embeddings.create(
-                model=self._model,
-                input=text,
-                dimensions=self._dimension,
+        if not texts:
+            return []
+
+        keys = [self._cache_key(text) for text in texts]
+        embeddings = (
+            await self._cache.get_many(keys) if self._cache else [None] * len(texts)
+        )
+
+        # Textos iguais (após normalização) são enviados à API uma única vez.
+        missing: dict[str, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings):
+            if embedding is None and key not in missing:
+                missing[key] = normalize_text(text)
+
+        if missing:
+            computed = await self._request_embeddings(
+                list(missing.values()), batch_size or self._batch_size
             )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            raise
+            by_key = dict(zip(missing.keys(), computed))
+            if self._cache:
+                await self._cache.set_many(list(by_key.items()))
+            embeddings = [
+                embedding if embedding is not None else by_key[key]
+                for key, embedding in zip(keys, embeddings)
+            ]
 
-    async def embed_batch(
-        self, texts: list[str], batch_size: int = 100
+        return embeddings
+
+    async def _request_embeddings(
+        self, texts: list[str], batch_size: int
     ) -> list[list[float]]:
-        if not self._client:
-            raise RuntimeError("OpenAI API key not configured")
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(self._request_batch(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
 
-        embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+    async def _request_batch(self, batch: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
             try:
-                response = await self._client.embeddings.create(
-                    model=self._model,
-                    input=batch,
-                    dimensions=self._dimension,
-                )
-                embeddings.extend([item.embedding for item in response.data])
+                async with self._semaphore:
+                    response = await self._client.embeddings.create(
+                        model=self._model,
+                        input=batch,
+                        dimensions=self._dimension,
+                    )
+                return [item.embedding for item in response.data]
+            except _RETRYABLE_ERRORS as e:
+                if attempt >= self._max_retries:
+                    logger.error(f"Error generating batch embeddings: {e}")
+                    raise
+                delay = self._retry_delay(e, attempt)
+                attempt += 1
+                logger.warning(f"Embedding request failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
             except Exception as e:
                 logger.error(f"Error generating batch embeddings: {e}")
                 raise
 
-        return embeddings
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        if isinstance(error, APIStatusError):
+            retry_after = error.response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY_SECONDS)
+                except ValueError:
+                    pass
+        return min(0.5 * 2**attempt, MAX_RETRY_DELAY_SECONDS) * random.uniform(0.5, 1.0)
+
+    def _cache_key(self, text: str) -> str:
+        return build_embedding_key(text, self._model, self._dimension)
 
     def is_configured(self) -> bool:
         return self._client is not None
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        return self._cache.stats if self._cache else {}
+
     @property
     def dimension(self) -> int:
         return self._dimension
-
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
+from uuid import uuid4
+
+from domain.ports.outbound.vector_store_port import VectorDocument, VectorStorePort
+from application.services.document_ids import (
+    INDEX_HASH_FIELD,
+    content_document_id,
+    content_hash,
+    index_hash,
+)
+from application.services.embedding_service import EmbeddingService
+from application.services.rag_service import RAGService
+
+logger = logging.getLogger(__name__)
+
+_JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Separadores preferidos ao cortar um chunk, do mais ao menos natural.
+_CHUNK_BREAKS = ("\n\n", "\n", ". ", " ")
+
+
+def chunk_text(text: str, chunk_size: int = 1500, overlap: int = 200) -> list[str]:
+    text = text.strip()
+    if len(text) <= chunk_size:
+        return [text] if text else []
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            window_start = start + chunk_size // 2
+            for separator in _CHUNK_BREAKS:
+                cut = text.rfind(separator, window_start, end)
+                if cut != -1:
+                    end = cut + len(separator)
+                    break
+
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= len(text):
+            break
+
+        # Recua para manter contexto entre chunks, começando em início de palavra.
+        next_start = max(end - overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+
+    return chunks
+
+
+def is_valid_job_id(job_id: str) -> bool:
+    return bool(_JOB_ID_PATTERN.match(job_id))
+
+
+class IngestionCheckpointStore:
+    """Guarda o progresso de cada job de ingestão em um JSON por job."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    async def load(self, job_id: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._load, job_id)
+
+    async def save(self, job_id: str, state: dict) -> None:
+        await asyncio.to_thread(self._save, job_id, state)
+
+    def _path(self, job_id: str) -> Path:
+        return self._directory / f"{job_id}.json"
+
+    def _load(self, job_id: str) -> Optional[dict]:
+        try:
+            return json.loads(self._path(job_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def _save(self, job_id: str, state: dict) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        target = self._path(job_id)
+        tmp_path = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, target)
+
+
+class KnowledgeIngestionService:
+    """
+    Ingestão em massa de documentos JSONL no vector store.
+
+    Cada linha é {"content": ..., "metadata": {...}, "id": opcional}.
+    Documentos longos são quebrados em chunks, os embeddings são gerados em
+    lotes grandes e os upserts saem em páginas paralelas. O checkpoint só
+    avança depois que um lote inteiro foi gravado, então retomar um job
+    nunca pula documentos. O ID de cada chunk vem do conteúdo, então chunks
+    já indexados com os mesmos metadados são pulados sem gerar embedding.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStorePort,
+        embedding_service: EmbeddingService,
+        rag_service: RAGService,
+        checkpoints: IngestionCheckpointStore,
+        chunk_size: int = 1500,
+        chunk_overlap: int = 200,
+        embed_batch_size: int = 512,
+        upsert_page_size: int = 256,
+        upsert_concurrency: int = 4,
+    ) -> None:
+        self._vector_store = vector_store
+        self._embedding_service = embedding_service
+        self._rag_service = rag_service
+        self._checkpoints = checkpoints
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._embed_batch_size = embed_batch_size
+        self._upsert_page_size = upsert_page_size
+        self._upsert_semaphore = asyncio.Semaphore(upsert_concurrency)
+
+    async def ingest(
+        self,
+        lines: AsyncIterable[str],
+        job_id: str,
+        collection_name: str | None = None,
+    ) -> AsyncIterator[dict]:
+        state = await self._checkpoints.load(job_id) or {
+            "line": 0,
+            "documents": 0,
+            "chunks": 0,
+            "stored": 0,
+            "errors": 0,
+            "completed": False,
+        }
+        state["completed"] = False
+        resume_from = state["line"]
+        yield {"event": "started", "job_id": job_id, "resumed_from_line": resume_from}
+
+        # Contadores só entram no state junto com o checkpoint: ao retomar, as
+        # linhas depois dele são processadas (e contadas) de novo.
+        pending: list[VectorDocument] = []
+        pending_documents = 0
+        pending_errors = 0
+        line_no = 0
+
+        async for raw in lines:
+            line_no += 1
+            if line_no <= resume_from:
+                continue
+
+            raw = raw.strip()
+            if not raw:
+                continue
+
+            try:
+                pending.extend(self._build_chunks(json.loads(raw)))
+                pending_documents += 1
+            except (ValueError, TypeError) as e:
+                pending_errors += 1
+                yield {"event": "error", "line": line_no, "error": str(e)}
+                continue
+
+            if len(pending) >= self._embed_batch_size:
+                try:
+                    stored = await self._store(pending, collection_name)
+                except Exception as e:
+                    yield self._failed_event(job_id, state, e)
+                    return
+
+                state["line"] = line_no
+                state["stored"] = state.get("stored", 0) + stored
+                state["documents"] += pending_documents
+                state["chunks"] += len(pending)
+                state["errors"] += pending_errors
+                await self._checkpoints.save(job_id, state)
+                yield {"event": "progress", **state}
+                pending = []
+                pending_documents = 0
+                pending_errors = 0
+
+        if pending:
+            try:
+                stored = await self._store(pending, collection_name)
+            except Exception as e:
+                yield self._failed_event(job_id, state, e)
+                return
+            state["stored"] = state.get("stored", 0) + stored
+            state["documents"] += pending_documents
+            state["chunks"] += len(pending)
+        state["errors"] += pending_errors
+
+        state["line"] = max(line_no, resume_from)
+        state["completed"] = True
+        await self._checkpoints.save(job_id, state)
+        logger.info(
+            f"Knowledge ingestion {job_id} complete: "
+            f"{state['documents']} documents, {state['chunks']} chunks"
+        )
+        yield {"event": "complete", "job_id": job_id, **state}
+
+    def _build_chunks(self, record: dict) -> list[VectorDocument]:
+        if not isinstance(record, dict):
+            raise ValueError("Each line must be a JSON object")
+
+        content = record.get("content")
+        if not isinstance(content, str) or not content.strip():
+            raise ValueError("Missing 'content'")
+
+        metadata = record.get("metadata") or {}
+        if not isinstance(metadata, dict):
+            raise ValueError("'metadata' must be an object")
+
+        source_id = record.get("id") or metadata.get("id")
+        source_id = str(source_id) if source_id else None
+        chunks = chunk_text(content, self._chunk_size, self._chunk_overlap)
+        # Registros sem ID são identificados pelo conteúdo completo, para que
+        # um trecho comum a dois registros não vire o mesmo ponto.
+        id_source = source_id or content_hash(content)
+
+        documents = []
+        for index, chunk in enumerate(chunks):
+            chunk_metadata = {
+                **metadata,
+                "chunk_index": index,
+                "chunk_count": len(chunks),
+                "content_hash": content_hash(chunk),
+            }
+            if source_id:
+                chunk_metadata["source_id"] = source_id
+            chunk_metadata[INDEX_HASH_FIELD] = index_hash(chunk, chunk_metadata)
+            documents.append(
+                VectorDocument(
+                    id=content_document_id(chunk, id_source),
+                    content=chunk,
+                    metadata=chunk_metadata,
+                )
+            )
+        return documents
+
+    async def _store(self, documents: list[VectorDocument], collection_name: str | None) -> int:
+        # Chunks repetidos no lote ou já indexados com os mesmos metadados
+        # são pulados; se só os metadados mudaram, o ponto é regravado (o
+        # embedding sai do cache, já que o conteúdo é o mesmo).
+        unique: dict[str, VectorDocument] = {}
+        for document in documents:
+            unique.setdefault(document.id, document)
+        if len(unique) < len(documents):
+            # Mesmo trecho repetido na mesma fonte: vale a primeira ocorrência.
+            logger.info(
+                f"Skipping {len(documents) - len(unique)} repeated chunks in batch, "
+                f"keeping the first occurrence's metadata"
+            )
+        stored = await self._vector_store.payload_values(
+            list(unique), INDEX_HASH_FIELD, collection_name
+        )
+        documents = [
+            document
+            for doc_id, document in unique.items()
+            if stored.get(doc_id) != document.metadata[INDEX_HASH_FIELD]
+        ]
+        if not documents:
+            return 0
+
+        embeddings = await self._embedding_service.embed_batch([d.content for d in documents])
+        for document, embedding in zip(documents, embeddings):
+            document.embedding = embedding
+
+        async def upsert(page: list[VectorDocument]) -> None:
+            async with self._upsert_semaphore:
+                # Via RAGService para invalidar caches e atualizar o índice léxico.
+                await self._rag_service.store_documents(page, collection_name)
+
+        size = self._upsert_page_size
+        await asyncio.gather(
+            *(upsert(documents[i : i + size]) for i in range(0, len(documents), size))
+        )
+        return len(documents)
+
+    def _failed_event(self, job_id: str, state: dict, error: Exception) -> dict:
+        logger.error(f"Knowledge ingestion {job_id} failed at line {state['line']}: {error}")
+        return {
+            "event": "failed",
+            "job_id": job_id,
+            "resume_from_line": state["line"],
+            "error": str(error),
+        }
@@ -1,19 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 import logging
 import re
-from typing import Literal
+from collections import OrderedDict
+from typing import Iterator, Literal, Optional
 
 from domain.ports.outbound.llm_provider_port import LLMProviderPort, LLMMessage
+from application.services.translation_memory import TranslationMemory
 
 logger = logging.getLogger(__name__)
 
 Language = Literal["pt", "en"]
 
+TRANSLATION_BATCH_SIZE = 40
+TRANSLATION_BATCH_MAX_CHARS = 6_000
+TRANSLATION_BATCH_MAX_TOKENS = 4_000
+
 
 class LanguageService:
-    def __init__(self, llm: LLMProviderPort):
+    def __init__(
+        self,
+        llm: LLMProviderPort,
+        max_concurrency: int = 4,
+        memo_max_entries: int = 5_000,
+        translation_memory: Optional[TranslationMemory] = None,
+    ):
         self._llm = llm
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._memo: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._memo_max_entries = memo_max_entries
+        self._translation_memory = translation_memory
+        self._memo_hits = 0
+        self._llm_translations = 0
+
+    @property
+    def translation_stats(self) -> dict:
+        return {
+            "memo_hits": self._memo_hits,
+            "memo_entries": len(self._memo),
+            "llm_translations": self._llm_translations,
+            "translation_memory": (
+                self._translation_memory.stats if self._translation_memory else None
+            ),
+        }
 
     def detect_language(self, text: str) -> Language:
         pt_indicators = [
@@ -44,41 +76,127 @@ class LanguageService:
 
     async def translate_resume_content(
         self, resume_data: dict, target_language: Language
-    ) -> dict:
+    ) -> tuple[dict, bool]:
+        """
+        Retorna (dados traduzidos, se todos os campos foram traduzidos).
+        Campos cuja tradução falhou ficam no idioma original.
+        """
         if target_language == "pt":
-            return resume_data
+            return resume_data, True
+
+        translated = copy.deepcopy(resume_data)
+        fields = list(_translatable_fields(translated))
+        if not fields:
+            return translated, True
 
-        logger.info(f"Translating resume content to {target_language}")
+        texts = list(dict.fromkeys(text for _, _, text in fields))
+        translations = await self.translate_texts(texts, target_language)
+        logger.info(
+            f"Translated resume content to {target_language}: "
+            f"{len(fields)} fields, {len(texts)} distinct strings"
+        )
 
-        translated = resume_data.copy()
+        for container, key, text in fields:
+            container[key] = translations.get(text, text)
+        return translated, len(translations) == len(texts)
 
-        if "professional_summary" in translated:
-            translated["professional_summary"] = await self._translate_text(
-                translated["professional_summary"], target_language
+    async def translate_texts(
+        self, texts: list[str], target_language: Language
+    ) -> dict[str, str]:
+        """
+        Traduz vários textos de uma vez; retorna texto original -> tradução.
+        Textos cuja tradução falhou ficam de fora do resultado.
+        """
+        translations: dict[str, str] = {}
+        pending: list[str] = []
+        for text in dict.fromkeys(texts):
+            memo = self._memo.get((target_language, text))
+            if memo is not None:
+                self._memo.move_to_end((target_language, text))
+                translations[text] = memo
+                self._memo_hits += 1
+            else:
+                pending.append(text)
+
+        if pending and self._translation_memory:
+            remembered = await self._translation_memory.lookup(pending, target_language)
+            for text, translation in remembered.items():
+                translations[text] = translation
+                self._remember(target_language, text, translation)
+            pending = [text for text in pending if text not in remembered]
+
+        if pending:
+            batches = await asyncio.gather(
+                *(
+                    self._translate_batch(batch, target_language)
+                    for batch in _split_batches(pending)
+                )
             )
+            fresh: dict[str, str] = {}
+            for batch in batches:
+                fresh.update(batch)
+            for text, translation in fresh.items():
+                translations[text] = translation
+                self._remember(target_language, text, translation)
+
+            self._llm_translations += len(fresh)
+            if self._translation_memory:
+                await self._translation_memory.store(fresh, target_language)
 
-        if "experiences" in translated:
-            for exp in translated["experiences"]:
-                if "position" in exp:
-                    exp["position"] = await self._translate_text(exp["position"], target_language)
-                if "description" in exp:
-                    exp["description"] = await self._translate_text(exp["description"], target_language)
-                if "achievements" in exp:
-                    exp["achievements"] = [
-                        await self._translate_text(ach, target_language) for ach in exp["achievements"]
-                    ]
-
-        if "education" in translated:
-            for edu in translated["education"]:
-                if isinstance(edu, dict):
-                    if "degree" in edu:
-                        edu["degree"] = await self._translate_text(edu["degree"], target_language)
-                    if "field" in edu:
-                        edu["field"] = await self._translate_text(edu["field"], target_language)
+        return translations
 
+    async def _translate_batch(
+        self, texts: list[str], target_language: Language
+    ) -> dict[str, str]:
+        # IDs curtos no lugar dos textos: a resposta é remontada por ID.
+        items = {str(i): text for i, text in enumerate(texts)}
+        prompt = f"""Translate each value of the JSON object below to {target_language.upper()}.
+Maintain professional tone and technical terms when appropriate.
+Return ONLY a JSON object with the same keys and the translated values.
+
+{json.dumps(items, ensure_ascii=False)}"""
+
+        translated: dict[str, str] = {}
+        async with self._semaphore:
+            try:
+                result = await self._llm.complete(
+                    messages=[LLMMessage(role="user", content=prompt)],
+                    temperature=0.2,
+                    max_tokens=TRANSLATION_BATCH_MAX_TOKENS,
+                )
+                response = _parse_json_object(result.content)
+                for item_id, text in items.items():
+                    value = response.get(item_id)
+                    if isinstance(value, str) and value.strip():
+                        translated[text] = value.strip()
+            except Exception as e:
+                logger.warning(f"Batch translation failed: {e}, translating individually")
+
+        # Itens que faltaram na resposta do lote seguem um a um.
+        missing = [text for text in texts if text not in translated]
+        if missing:
+            results = await asyncio.gather(
+                *(self._translate_single(text, target_language) for text in missing)
+            )
+            translated.update(
+                (text, result) for text, result in zip(missing, results) if result is not None
+            )
         return translated
 
-    async def _translate_text(self, text: str, target_language: Language) -> str:
+    async def _translate_single(self, text: str, target_language: Language) -> Optional[str]:
+        async with self._semaphore:
+            return await self._translate_text(text, target_language)
+
+    def _remember(self, target_language: Language, text: str, translation: str) -> None:
+        if translation == text:
+            # Texto que não muda na tradução não precisa de memória.
+            return
+        self._memo[(target_language, text)] = translation
+        while len(self._memo) > self._memo_max_entries:
+            self._memo.popitem(last=False)
+
+    async def _translate_text(self, text: str, target_language: Language) -> Optional[str]:
+        """Tradução do texto, ou None se a chamada ao LLM falhar."""
         if not text or not text.strip():
             return text
 
@@ -97,6 +215,65 @@ Text to translate:
             )
             return result.content.strip()
         except Exception as e:
-            logger.warning(f"Translation failed: {e}, returning original")
-            return text
+            logger.warning(f"Translation failed: {e}, keeping original")
+            return None
+
+
+def _translatable_fields(resume_data: dict) -> Iterator[tuple[dict | list, str | int, str]]:
+    """(container, chave, texto) de cada campo traduzível do currículo."""
+
+    def text_at(container, key):
+        value = container[key]
+        # Sem letras (datas, números) não há o que traduzir.
+        if isinstance(value, str) and any(c.isalpha() for c in value):
+            return value
+        return None
+
+    if "professional_summary" in resume_data and text_at(resume_data, "professional_summary"):
+        yield resume_data, "professional_summary", resume_data["professional_summary"]
+
+    for exp in resume_data.get("experiences") or []:
+        for key in ("position", "description"):
+            if key in exp and text_at(exp, key):
+                yield exp, key, exp[key]
+        date_range = exp.get("date_range")
+        if isinstance(date_range, dict):
+            for key in ("start_formatted", "end_formatted"):
+                if key in date_range and text_at(date_range, key):
+                    yield date_range, key, date_range[key]
+        achievements = exp.get("achievements") or []
+        for i in range(len(achievements)):
+            if text_at(achievements, i):
+                yield achievements, i, achievements[i]
+
+    for edu in resume_data.get("education") or []:
+        if isinstance(edu, dict):
+            for key in ("degree", "field"):
+                if key in edu and text_at(edu, key):
+                    yield edu, key, edu[key]
+
+
+def _split_batches(texts: list[str]) -> Iterator[list[str]]:
+    batch: list[str] = []
+    size = 0
+    for text in texts:
+        full = len(batch) >= TRANSLATION_BATCH_SIZE or size + len(text) > TRANSLATION_BATCH_MAX_CHARS
+        if batch and full:
+            yield batch
+            batch, size = [], 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        yield batch
+
 
+def _parse_json_object(content: str) -> dict:
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("```")[1]
+        if content.startswith("json"):
+            content = content[4:]
+    data = json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return data
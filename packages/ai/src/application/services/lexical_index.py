@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+import re
+import time
+import unicodedata
+from collections import Counter
+from typing import Optional
+
+from domain.ports.outbound.vector_store_port import (
+    VectorDocument,
+    VectorStorePort,
+    matches_filter,
+)
+
+logger = logging.getLogger(__name__)
+
+# Mantém termos técnicos como "c++", "c#" e "node.js" inteiros.
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+_STOPWORDS = frozenset(
+    """
+    a o e as os de da do das dos em no na nos nas um uma uns umas para por com sem que se
+    ao aos ou mais como ser sua seu suas seus sobre entre pelo pela pelos pelas
+    the an and or of to in on for with by at from is are be as it this that
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    return [t for t in _TOKEN_PATTERN.findall(folded) if t not in _STOPWORDS]
+
+
+class BM25Index:
+    """
+    Índice invertido com pontuação BM25 sobre o conteúdo dos documentos.
+
+    Guarda só os termos e os metadados de cada documento, nunca o texto:
+    o conteúdo dos resultados vem sempre do vector store.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._terms: dict[str, tuple[str, ...]] = {}
+        self._metadata: dict[str, dict] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, document: VectorDocument) -> None:
+        self.remove(document.id)
+
+        tokens = tokenize(document.content)
+        frequencies = Counter(tokens)
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[document.id] = frequency
+
+        self._lengths[document.id] = len(tokens)
+        self._total_length += len(tokens)
+        self._terms[document.id] = tuple(frequencies)
+        self._metadata[document.id] = document.metadata
+
+    def remove(self, document_id: str) -> None:
+        terms = self._terms.pop(document_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(document_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(document_id, 0)
+        self._metadata.pop(document_id, None)
+
+    def search(
+        self,
+        query_terms: list[str],
+        limit: int,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[tuple[str, float]]:
+        total = len(self._lengths)
+        if not total or not query_terms:
+            return []
+
+        average_length = self._total_length / total
+        scores: dict[str, float] = {}
+
+        for term in set(query_terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for document_id, frequency in postings.items():
+                norm = 1 - self._b + self._b * self._lengths[document_id] / average_length
+                scores[document_id] = scores.get(document_id, 0.0) + idf * (
+                    frequency * (self._k1 + 1) / (frequency + self._k1 * norm)
+                )
+
+        if filter_metadata:
+            scores = {
+                document_id: score
+                for document_id, score in scores.items()
+                if matches_filter(self._metadata[document_id], filter_metadata)
+            }
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def coverage(self, query_terms: list[str], document_id: str) -> float:
+        """Fração dos termos da query presentes no documento."""
+        terms = set(query_terms)
+        if not terms:
+            return 0.0
+        matched = sum(1 for term in terms if document_id in self._postings.get(term, ()))
+        return matched / len(terms)
+
+
+class LexicalIndex:
+    """
+    Um BM25Index por collection, construído a partir do vector store.
+
+    A construção roda em background na primeira consulta à collection;
+    enquanto não termina, get() retorna None e a busca segue só vetorial.
+    Escritas feitas pelo RAGService atualizam o índice incrementalmente, mas
+    escritas de outras instâncias só aparecem na reconstrução periódica
+    (refresh_seconds), feita em background enquanto o índice antigo segue
+    servindo. Por isso o índice pode estar defasado: quem consulta deve
+    conferir no vector store os documentos achados só por ele.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStorePort,
+        default_collection: str,
+        max_documents: int = 200_000,
+        refresh_seconds: float = 300.0,
+        retry_seconds: float = 60.0,
+    ) -> None:
+        self._vector_store = vector_store
+        self._default_collection = default_collection
+        self._max_documents = max_documents
+        self._refresh_seconds = refresh_seconds
+        self._retry_seconds = retry_seconds
+        self._indexes: dict[str, BM25Index] = {}
+        self._built_at: dict[str, float] = {}
+        # Índices em construção também recebem as escritas locais.
+        self._building: dict[str, BM25Index] = {}
+        self._failed_until: dict[str, float] = {}
+        self._disabled: set[str] = set()
+        self._build_tasks: dict[str, asyncio.Task] = {}
+
+    def get(self, collection_name: str | None) -> Optional[BM25Index]:
+        name = collection_name or self._default_collection
+        index = self._indexes.get(name)
+        if self._should_build(name):
+            self._build_tasks[name] = asyncio.create_task(self._build(name))
+        return index
+
+    def add(self, collection_name: str | None, documents: list[VectorDocument]) -> None:
+        for index in self._targets(collection_name):
+            for document in documents:
+                index.add(document)
+
+    def remove(self, collection_name: str | None, document_ids: list[str]) -> None:
+        for index in self._targets(collection_name):
+            for document_id in document_ids:
+                index.remove(document_id)
+
+    async def close(self) -> None:
+        for task in self._build_tasks.values():
+            task.cancel()
+
+    def _should_build(self, name: str) -> bool:
+        if name in self._disabled or name in self._build_tasks:
+            return False
+        now = time.monotonic()
+        if now < self._failed_until.get(name, 0.0):
+            return False
+        built_at = self._built_at.get(name)
+        return built_at is None or now - built_at >= self._refresh_seconds
+
+    def _targets(self, collection_name: str | None) -> list[BM25Index]:
+        name = collection_name or self._default_collection
+        return [
+            index
+            for index in (self._indexes.get(name), self._building.get(name))
+            if index is not None
+        ]
+
+    async def _build(self, name: str) -> None:
+        index = BM25Index()
+        self._building[name] = index
+        try:
+            async for page in self._vector_store.scroll_documents(name, include_vectors=False):
+                for document in page:
+                    index.add(document)
+                if len(index) > self._max_documents:
+                    logger.warning(
+                        f"Collection {name} exceeds {self._max_documents} documents; "
+                        f"lexical retrieval disabled for it"
+                    )
+                    self._disable(name)
+                    return
+        except NotImplementedError:
+            self._disable(name)
+            return
+        except Exception as e:
+            # Guarda a falha para não tentar de novo a cada busca; o índice
+            # anterior, se houver, continua servindo até a próxima tentativa.
+            logger.error(
+                f"Failed to build lexical index for {name}: {e}; "
+                f"retrying in {self._retry_seconds:.0f}s"
+            )
+            self._failed_until[name] = time.monotonic() + self._retry_seconds
+            return
+        finally:
+            self._building.pop(name, None)
+            self._build_tasks.pop(name, None)
+
+        self._indexes[name] = index
+        self._built_at[name] = time.monotonic()
+        self._failed_until.pop(name, None)
+        logger.info(f"Lexical index ready for {name} ({len(index)} documents)")
+
+    def _disable(self, name: str) -> None:
+        self._disabled.add(name)
+        self._indexes.pop(name, None)
+        self._built_at.pop(name, None)
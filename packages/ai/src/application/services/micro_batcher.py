@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Junta chamadas concorrentes em um único lote.
+
+    Cada item submetido espera no máximo max_wait_seconds (ou até o lote
+    atingir max_batch_size) e então o handler é chamado uma vez com todos os
+    itens acumulados, devolvendo um resultado por item na mesma ordem.
+
+    Se o handler falha com um erro de split_on, o lote é dividido ao meio e
+    cada metade é reenviada, até isolar o item que causa a falha: só quem
+    enviou esse item recebe a exceção. Outros erros valem para o lote todo.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[Sequence[R]]],
+        max_batch_size: int = 100,
+        max_wait_seconds: float = 0.005,
+        split_on: tuple[type[Exception], ...] = (Exception,),
+    ) -> None:
+        self._handler = handler
+        self._split_on = split_on
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_seconds
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        # Mantém referência até o fim para a task não ser coletada.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        try:
+            results = await self._handler([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) > 1 and isinstance(e, self._split_on):
+                middle = len(batch) // 2
+                logger.warning(f"Batch of {len(batch)} failed ({e}), retrying in halves")
+                await asyncio.gather(self._run(batch[:middle]), self._run(batch[middle:]))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
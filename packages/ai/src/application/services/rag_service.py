@@ -1,23 +1,51 @@
 from __future__ import annotations
 
 import logging
+import math
+from dataclasses import replace
 from typing import Optional
 
 from domain.ports.outbound.vector_store_port import VectorDocument, VectorSearchResult
 from domain.ports.outbound.vector_store_port import VectorStorePort
+from application.services.context_packer import ContextPacker
+from application.services.document_ids import (
+    INDEX_HASH_FIELD,
+    content_document_id,
+    content_hash,
+    index_hash,
+)
 from application.services.embedding_service import EmbeddingService
+from application.services.lexical_index import BM25Index, LexicalIndex, tokenize
+from application.services.retrieval_cache import RetrievalCache
 
 logger = logging.getLogger(__name__)
 
+# Constante padrão do Reciprocal Rank Fusion (Cormack et al.).
+RRF_K = 60
+# Peso da cobertura de termos da query no re-rank.
+RERANK_COVERAGE_WEIGHT = 0.5
+# Documentos achados só pelo BM25 precisam conter ao menos essa fração dos termos.
+LEXICAL_MIN_COVERAGE = 0.5
+
 
 class RAGService:
     def __init__(
         self,
         vector_store: VectorStorePort,
         embedding_service: EmbeddingService,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        lexical_index: Optional[LexicalIndex] = None,
+        hybrid_candidates: int = 4,
+        rerank: bool = True,
+        context_packer: Optional[ContextPacker] = None,
     ):
         self._vector_store = vector_store
         self._embedding_service = embedding_service
+        self._retrieval_cache = retrieval_cache
+        self._lexical_index = lexical_index
+        self._hybrid_candidates = hybrid_candidates
+        self._rerank = rerank
+        self._context_packer = context_packer or ContextPacker()
 
     async def retrieve_context(
         self,
@@ -26,30 +54,141 @@ class RAGService:
         limit: int = 5,
         min_score: float = 0.7,
         filter_metadata: Optional[dict] = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
     ) -> list[VectorSearchResult]:
         try:
             query_embedding = await self._embedding_service.embed_text(query)
 
-            results = await self._vector_store.search(
-                query=query,
-                collection_name=collection_name,
-                limit=limit,
-                filter_metadata=filter_metadata,
-                query_vector=query_embedding,
-            )
+            lexical = self._lexical_index.get(collection_name) if self._lexical_index else None
 
-            filtered_results = [
-                r for r in results if r.score >= min_score
-            ]
+            cache_key = None
+            if self._retrieval_cache:
+                cache_key = self._retrieval_cache.build_key(
+                    query_embedding,
+                    collection_name,
+                    limit=limit,
+                    min_score=min_score,
+                    filter=filter_metadata,
+                    fields=payload_fields,
+                    content=include_content,
+                    hybrid=lexical is not None,
+                )
+                cached = self._retrieval_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            if lexical is None:
+                results = await self._vector_store.search(
+                    query=query,
+                    collection_name=collection_name,
+                    limit=limit,
+                    filter_metadata=filter_metadata,
+                    query_vector=query_embedding,
+                    score_threshold=min_score,
+                    payload_fields=payload_fields,
+                    include_content=include_content,
+                )
+            else:
+                results = await self._hybrid_search(
+                    query,
+                    query_embedding,
+                    lexical,
+                    collection_name=collection_name,
+                    limit=limit,
+                    min_score=min_score,
+                    filter_metadata=filter_metadata,
+                    payload_fields=payload_fields,
+                    include_content=include_content,
+                )
+
+            if cache_key:
+                self._retrieval_cache.set(cache_key, results)
 
             logger.info(
-                f"Retrieved {len(filtered_results)} relevant documents for query"
+                f"Retrieved {len(results)} relevant documents for query"
             )
-            return filtered_results
+            return results
         except Exception as e:
             logger.error(f"Error retrieving context: {e}")
             return []
 
+    async def _hybrid_search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        lexical: BM25Index,
+        collection_name: str | None,
+        limit: int,
+        min_score: float,
+        filter_metadata: Optional[dict],
+        payload_fields: Optional[list[str]],
+        include_content: bool,
+    ) -> list[VectorSearchResult]:
+        """
+        Combina o ranking vetorial com o BM25 via Reciprocal Rank Fusion.
+
+        A ordem segue o score fundido (e re-ranqueado), exposto em
+        fused_score; score e distance continuam sendo a similaridade de
+        cosseno. Documentos achados só pelo BM25 são buscados no vector
+        store (o índice léxico pode estar defasado) e também precisam de
+        similaridade >= min_score.
+        """
+        candidates = limit * self._hybrid_candidates
+        query_terms = tokenize(query)
+
+        vector_results = await self._vector_store.search(
+            query=query,
+            collection_name=collection_name,
+            limit=candidates,
+            filter_metadata=filter_metadata,
+            query_vector=query_embedding,
+            score_threshold=min_score,
+            payload_fields=payload_fields,
+            include_content=include_content,
+        )
+        by_id = {result.document.id: result for result in vector_results}
+
+        lexical_ids = [
+            document_id
+            for document_id, _ in lexical.search(query_terms, candidates, filter_metadata)
+            if document_id in by_id
+            or lexical.coverage(query_terms, document_id) >= LEXICAL_MIN_COVERAGE
+        ]
+        lexical_only = await self._vector_store.get_documents(
+            [document_id for document_id in lexical_ids if document_id not in by_id],
+            collection_name=collection_name,
+            payload_fields=payload_fields,
+            include_content=include_content,
+            include_vectors=True,
+        )
+        for document in lexical_only:
+            score = _cosine(query_embedding, document.embedding)
+            if score >= min_score:
+                document.embedding = None
+                by_id[document.id] = VectorSearchResult(
+                    document=document, score=score, distance=1.0 - score
+                )
+
+        fused: dict[str, float] = {}
+        for rank, result in enumerate(vector_results):
+            fused[result.document.id] = 1 / (RRF_K + rank + 1)
+        lexical_ids = [document_id for document_id in lexical_ids if document_id in by_id]
+        for rank, document_id in enumerate(lexical_ids):
+            fused[document_id] = fused.get(document_id, 0.0) + 1 / (RRF_K + rank + 1)
+
+        if self._rerank:
+            # Re-rank leve: favorece documentos que contêm mais termos exatos da query.
+            for document_id in fused:
+                coverage = lexical.coverage(query_terms, document_id)
+                fused[document_id] *= 1 + RERANK_COVERAGE_WEIGHT * coverage
+
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            replace(by_id[document_id], fused_score=fused_score)
+            for document_id, fused_score in ranked
+        ]
+
     async def enrich_prompt(
         self,
         user_query: str,
@@ -65,12 +204,7 @@ class RAGService:
         if not context_results:
             return user_query
 
-        context_text = "\n\n".join(
-            [
-                f"[Contexto {i+1}]\n{r.document.content}"
-                for i, r in enumerate(context_results)
-            ]
-        )
+        context_text = self.build_context(context_results, "Contexto")
 
         enriched_prompt = f"""Com base no seguinte contexto de mercado e conhecimento:
 
@@ -86,6 +220,19 @@ Use o contexto acima para fornecer respostas mais precisas e atualizadas."""
 
         return enriched_prompt
 
+    def build_context(
+        self,
+        results: list[VectorSearchResult],
+        label: str,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Bloco "[label i]" com os documentos, sem repetições e dentro do orçamento de tokens."""
+        return self._context_packer.pack(
+            [r.document.content for r in results],
+            label=lambda i: f"[{label} {i}]",
+            max_tokens=max_tokens,
+        )
+
     async def add_knowledge(
         self,
         content: str,
@@ -93,22 +240,74 @@ Use o contexto acima para fornecer respostas mais precisas e atualizadas."""
         collection_name: str | None = None,
     ) -> str:
         try:
+            explicit_id = metadata.get("id")
+            doc_id = str(explicit_id) if explicit_id else content_document_id(content)
+            metadata = {**metadata, "content_hash": content_hash(content)}
+            metadata[INDEX_HASH_FIELD] = index_hash(content, metadata)
+
+            # Mesmo conteúdo e mesmos metadados: o ponto gravado já é este.
+            stored = await self._vector_store.payload_values(
+                [doc_id], INDEX_HASH_FIELD, collection_name
+            )
+            if stored.get(doc_id) == metadata[INDEX_HASH_FIELD]:
+                logger.info(f"Knowledge {doc_id} already indexed, skipping")
+                return doc_id
+
             embedding = await self._embedding_service.embed_text(content)
 
             doc = VectorDocument(
-                id=metadata.get("id", f"doc_{hash(content)}"),
+                id=doc_id,
                 content=content,
                 metadata=metadata,
                 embedding=embedding,
             )
 
-            doc_ids = await self._vector_store.add_documents(
-                documents=[doc],
-                collection_name=collection_name,
-            )
-
+            doc_ids = await self.store_documents([doc], collection_name)
             return doc_ids[0] if doc_ids else ""
         except Exception as e:
             logger.error(f"Error adding knowledge: {e}")
             raise
 
+    async def store_documents(
+        self,
+        documents: list[VectorDocument],
+        collection_name: str | None = None,
+    ) -> list[str]:
+        """Grava documentos já com embedding e mantém caches e índice léxico em dia."""
+        try:
+            doc_ids = await self._vector_store.add_documents(
+                documents=documents,
+                collection_name=collection_name,
+            )
+        finally:
+            # Mesmo com falha parcial alguns pontos podem ter sido gravados.
+            self._invalidate(collection_name)
+
+        if self._lexical_index:
+            self._lexical_index.add(collection_name, documents)
+        return doc_ids
+
+    async def delete_knowledge(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> int:
+        deleted = await self._vector_store.delete_documents(
+            document_ids=document_ids,
+            collection_name=collection_name,
+        )
+        self._invalidate(collection_name)
+        if self._lexical_index:
+            self._lexical_index.remove(collection_name, document_ids)
+        return deleted
+
+    def _invalidate(self, collection_name: str | None) -> None:
+        if self._retrieval_cache:
+            self._retrieval_cache.invalidate(collection_name)
+
+
+def _cosine(a: list[float], b: Optional[list[float]]) -> float:
+    if not b:
+        return 0.0
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
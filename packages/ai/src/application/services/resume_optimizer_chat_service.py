@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from domain.ports.outbound.llm_provider_port import LLMProviderPort
 from domain.ports.outbound.pdf_renderer_port import PDFRendererPort
-from domain.chains import CompatibilityChain, OptimizationChain, CreativeBuilderChain, PDFChain
+from domain.ports.outbound.cache_port import CachePort
+from domain.chains import (
+    CompatibilityChain,
+    CreativeBuilderChain,
+    JobAnalysisChain,
+    OptimizationChain,
+    PDFChain,
+)
 from application.pipelines import ResumePipeline
+from application.pipelines.result_cache import PipelineResultCache
 from application.services.chat_context_service import ChatContext
 from application.services.language_service import LanguageService
+from application.services.translation_memory import TranslationMemory
 from infrastructure.prompt_loader import PromptLoader
 
 logger = logging.getLogger(__name__)
 
+# Intervalo máximo sem eventos antes de mandar um heartbeat ao cliente.
+HEARTBEAT_SECONDS = 10.0
+
 
 @dataclass
 class ChatOptimizationResult:
@@ -28,25 +41,53 @@ class ResumeOptimizerChatService:
         self,
         llm_provider: LLMProviderPort,
         pdf_renderer: Optional[PDFRendererPort] = None,
+        result_cache: Optional[PipelineResultCache] = None,
+        cache: Optional[CachePort] = None,
+        job_analysis_ttl_seconds: int = 7 * 86_400,
+        translation_memory: Optional[TranslationMemory] = None,
     ):
         self._llm = llm_provider
         self._pdf = pdf_renderer
+        self._result_cache = result_cache
+        self._cache = cache
+        self._job_analysis_ttl_seconds = job_analysis_ttl_seconds
+        self._language_service = LanguageService(
+            self._llm, translation_memory=translation_memory
+        )
         self._prompt_loader = PromptLoader()
+        self._job_analysis = JobAnalysisChain(
+            self._llm,
+            self._prompt_loader,
+            cache=self._cache,
+            ttl_seconds=self._job_analysis_ttl_seconds,
+        )
         self._pipeline = self._build_pipeline()
 
     def _build_pipeline(self) -> ResumePipeline:
-        language_service = LanguageService(self._llm)
+        language_service = self._language_service
         return ResumePipeline(
             compatibility_chain=CompatibilityChain(self._llm, self._prompt_loader),
             optimization_chain=OptimizationChain(self._llm, self._prompt_loader),
             creative_chain=CreativeBuilderChain(self._llm, self._prompt_loader),
             pdf_chain=PDFChain(self._pdf, language_service),
+            language_service=language_service,
+            result_cache=self._result_cache,
+            model_name=self._llm.get_model_name(),
+            job_analysis_chain=self._job_analysis,
         )
 
+    @property
+    def translation_stats(self) -> dict:
+        return self._language_service.translation_stats
+
+    async def close(self) -> None:
+        await self._job_analysis.close()
+
     async def process_optimization(
         self,
         context: ChatContext,
         messages: list[dict],
+        bypass_cache: bool = False,
     ) -> ChatOptimizationResult:
         resume_content = self._extract_resume_from_messages(messages)
         job_description = context.job_description or ""
@@ -57,7 +98,9 @@ class ResumeOptimizerChatService:
                 model=self._llm.get_model_name(),
             )
 
-        result = await self._pipeline.run(resume_content, job_description)
+        result = await self._pipeline.run(
+            resume_content, job_description, bypass_cache=bypass_cache
+        )
 
         return ChatOptimizationResult(
             content=result.content,
@@ -65,6 +108,78 @@ class ResumeOptimizerChatService:
             model=self._llm.get_model_name(),
         )
 
+    async def stream_optimization(
+        self,
+        context: ChatContext,
+        messages: list[dict],
+        bypass_cache: bool = False,
+    ) -> AsyncIterator[dict]:
+        """
+        Roda o pipeline emitindo eventos de progresso. Termina com complete
+        (conteúdo final e pdf_url) ou failed; heartbeat sai sempre que o
+        pipeline fica HEARTBEAT_SECONDS sem emitir nada. Eventos token trazem
+        a saída bruta do modelo (JSON parcial), não texto para exibir.
+        """
+        model = self._llm.get_model_name()
+        resume_content = self._extract_resume_from_messages(messages)
+        job_description = context.job_description or ""
+
+        yield {"event": "started", "model": model}
+
+        if not resume_content:
+            yield {
+                "event": "complete",
+                "content": "Não encontrei o conteúdo do seu currículo. Por favor, envie novamente.",
+                "pdf_url": None,
+                "model": model,
+            }
+            return
+
+        events: asyncio.Queue[dict] = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self._pipeline.run(
+                resume_content,
+                job_description,
+                on_event=events.put_nowait,
+                bypass_cache=bypass_cache,
+            )
+        )
+
+        try:
+            while not task.done() or not events.empty():
+                getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    {getter, task},
+                    timeout=HEARTBEAT_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                if not done:
+                    yield {"event": "heartbeat"}
+
+            try:
+                result = task.result()
+            except Exception as e:
+                logger.error(f"Streaming optimization failed: {e}")
+                yield {"event": "failed", "error": str(e), "model": model}
+                return
+
+            yield {
+                "event": "complete",
+                "success": result.success,
+                "content": result.content,
+                "pdf_url": result.pdf_url,
+                "model": model,
+                "cached": result.cached,
+                "timings": result.timings,
+            }
+        finally:
+            # Cliente desconectou no meio: não deixa o pipeline rodando à toa.
+            task.cancel()
+
     def _extract_resume_from_messages(self, messages: list[dict]) -> Optional[str]:
         for msg in messages:
             if msg.get("role") != "user":
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from application.services.embedding_cache import pack_vector
+from domain.ports.outbound.vector_store_port import VectorSearchResult
+
+
+class RetrievalCache:
+    """
+    Cache com TTL dos resultados de busca vetorial.
+
+    Cada collection tem um contador de geração que entra na chave; escrever
+    na collection incrementa o contador e todas as entradas antigas deixam
+    de ser encontradas (e saem pelo LRU/TTL).
+    """
+
+    def __init__(
+        self,
+        default_collection: str,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 1000,
+    ) -> None:
+        self._default_collection = default_collection
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, list[VectorSearchResult]]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "entries": len(self._entries)}
+
+    def build_key(
+        self,
+        query_vector: Sequence[float],
+        collection_name: Optional[str],
+        **params: Any,
+    ) -> str:
+        collection = collection_name or self._default_collection
+        digest = hashlib.sha256(pack_vector(query_vector))
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        return f"{collection}:{self._generations.get(collection, 0)}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[list[VectorSearchResult]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return list(entry[1])
+
+    def set(self, key: str, results: list[VectorSearchResult]) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, list(results))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, collection_name: Optional[str]) -> None:
+        collection = collection_name or self._default_collection
+        self._generations[collection] = self._generations.get(collection, 0) + 1
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import unicodedata
+
+
+def normalize_text(text: str) -> str:
+    """NFKC com espaços colapsados: a forma usada em hashes de conteúdo."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import unicodedata
+from typing import Sequence
+
+from domain.ports.outbound.cache_port import CachePort
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "tm"
+
+
+def normalize_source(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class TranslationMemory:
+    """
+    Memória de tradução compartilhada: texto de origem normalizado + idioma
+    -> tradução, consultada por correspondência exata antes de qualquer
+    chamada ao LLM. Usa um CachePort próprio (Redis em produção, SQLite
+    em um nó só), então vale entre usuários, instâncias e reinícios.
+    """
+
+    def __init__(self, cache: CachePort, ttl_seconds: int = 90 * 86_400) -> None:
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._stored = 0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        lookups = self._hits + self._misses
+        return {
+            "lookups": lookups,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "stored": self._stored,
+        }
+
+    async def lookup(self, texts: Sequence[str], target_language: str) -> dict[str, str]:
+        if not texts:
+            return {}
+
+        keys = [self._build_key(text, target_language) for text in texts]
+        try:
+            values = await self._cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            values = [None] * len(texts)
+
+        found = {text: value for text, value in zip(texts, values) if isinstance(value, str)}
+        self._hits += len(found)
+        self._misses += len(texts) - len(found)
+        return found
+
+    async def store(self, translations: dict[str, str], target_language: str) -> None:
+        items = {
+            self._build_key(text, target_language): translation
+            for text, translation in translations.items()
+            if translation and translation != text
+        }
+        if not items:
+            return
+
+        try:
+            if await self._cache.set_many(items, ttl_seconds=self._ttl_seconds):
+                self._stored += len(items)
+        except Exception as e:
+            logger.warning(f"Translation memory store failed: {e}")
+
+    def _build_key(self, text: str, target_language: str) -> str:
+        digest = hashlib.sha256(normalize_source(text).encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{target_language}:{digest}"
@@ -104,13 +104,8 @@ Output: JSON com a otimização."""
                     limit=3,
                     min_score=0.7,
                 )
-                if market_context:
-                    context_text = "\n\n".join(
-                        [
-                            f"[Conhecimento de Mercado {i+1}]\n{r.document.content}"
-                            for i, r in enumerate(market_context)
-                        ]
-                    )
+                context_text = self._rag.build_context(market_context, "Conhecimento de Mercado")
+                if context_text:
                     job_description = f"""{job_description}
 
 === CONHECIMENTO DE MERCADO ===
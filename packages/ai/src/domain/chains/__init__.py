@@ -1,9 +1,12 @@
+from domain.chains.job_analysis_chain import JobAnalysis, JobAnalysisChain
 from domain.chains.compatibility_chain import CompatibilityChain, CompatibilityResult
 from domain.chains.optimization_chain import OptimizationChain, OptimizationResult
 from domain.chains.creative_builder_chain import CreativeBuilderChain, CreativeResult
 from domain.chains.pdf_chain import PDFChain
 
 __all__ = [
+    "JobAnalysis",
+    "JobAnalysisChain",
     "CompatibilityChain",
     "CompatibilityResult",
     "OptimizationChain",
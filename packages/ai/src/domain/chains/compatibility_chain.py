@@ -7,6 +7,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from domain.chains.job_analysis_chain import JobAnalysis
 from domain.ports.outbound.llm_provider_port import LLMProviderPort, LLMMessage
 from infrastructure.prompt_loader import PromptLoader
 
@@ -33,12 +34,20 @@ class CompatibilityChain:
         self._llm = llm
         self._prompt = prompt_loader.load("compatibility")
 
+    @property
+    def prompt_version(self) -> str:
+        return self._prompt.version
+
     async def run(
-        self, resume_content: str, job_description: str
+        self,
+        resume_content: str,
+        job_description: str,
+        job_analysis: Optional[JobAnalysis] = None,
     ) -> CompatibilityResult:
+        # Com a vaga já analisada o prompt leva só o resumo dela.
         user_prompt = self._prompt.format_user(
             resume_content=resume_content,
-            job_description=job_description,
+            job_section=job_analysis.to_prompt() if job_analysis else job_description,
         )
 
         result = await self._llm.complete(
@@ -54,6 +63,8 @@ class CompatibilityChain:
             content = self._parse_json(result.content)
             if content.get("pivot_strategy") is None:
                 content["pivot_strategy"] = ""
+            if job_analysis:
+                content["job_area"] = job_analysis.job_area
             return CompatibilityResult(**content)
         except Exception as e:
             logger.warning(f"Failed to parse compatibility: {e}")
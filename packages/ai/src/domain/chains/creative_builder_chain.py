@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
 
@@ -51,11 +51,16 @@ class CreativeBuilderChain:
         self._llm = llm
         self._prompt = prompt_loader.load("creative_builder")
 
+    @property
+    def prompt_version(self) -> str:
+        return self._prompt.version
+
     async def run(
         self,
         candidate_info: str,
         job_description: str,
         allow_fictional: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> CreativeResult:
         special_instructions = ""
         if allow_fictional:
@@ -73,17 +78,18 @@ O usuário autorizou a criação de experiências fictícias se necessário.
             special_instructions=special_instructions,
         )
 
-        result = await self._llm.complete(
-            messages=[
+        response = await self._llm.generate(
+            [
                 LLMMessage(role="system", content=self._prompt.system),
                 LLMMessage(role="user", content=user_prompt),
             ],
             temperature=self._prompt.temperature,
             max_tokens=self._prompt.max_tokens,
+            on_token=on_token,
         )
 
         try:
-            content = self._parse_json(result.content)
+            content = self._parse_json(response)
             return CreativeResult(**content)
         except Exception as e:
             logger.error(f"Failed to parse creative result: {e}")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import unicodedata
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from domain.ports.outbound.cache_port import CachePort
+from domain.ports.outbound.llm_provider_port import LLMProviderPort, LLMMessage
+from infrastructure.prompt_loader import PromptLoader
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "job_analysis"
+# Marca que a vaga já foi vista uma vez, sem análise.
+SEEN_KEY_PREFIX = "job_analysis_seen"
+
+
+class JobAnalysis(BaseModel):
+    job_area: str
+    seniority: str = "não informado"
+    requirements: list[str] = Field(default_factory=list)
+    keywords: list[str] = Field(default_factory=list)
+    summary: str = ""
+
+    def to_prompt(self) -> str:
+        requirements = "\n".join(f"- {r}" for r in self.requirements) or "- Não informado"
+        return f"""Área: {self.job_area}
+Senioridade: {self.seniority}
+Resumo: {self.summary}
+Requisitos:
+{requirements}
+Palavras-chave: {", ".join(self.keywords)}"""
+
+
+def job_fingerprint(job_description: str) -> str:
+    normalized = " ".join(unicodedata.normalize("NFKC", job_description).casefold().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class JobAnalysisChain:
+    """
+    Análise do lado da vaga (área, senioridade, requisitos), que não depende
+    do candidato. O resultado fica no cache por fingerprint da descrição, e
+    a comparação candidato x vaga passa a receber só essa versão compacta.
+
+    lookup() nunca espera o LLM e retorna None sem cache, e quem chamou
+    segue com a descrição completa. A análise (uma chamada extra ao LLM) só
+    é disparada em background a partir da segunda vez que a vaga aparece,
+    para não dobrar o custo de vagas vistas uma vez só; a primeira apenas
+    deixa uma marca no cache. close() cancela as análises em andamento.
+    """
+
+    def __init__(
+        self,
+        llm: LLMProviderPort,
+        prompt_loader: PromptLoader,
+        cache: Optional[CachePort] = None,
+        ttl_seconds: int = 7 * 86_400,
+    ):
+        self._llm = llm
+        self._prompt = prompt_loader.load("job_analysis")
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds
+        self._pending: dict[str, asyncio.Task] = {}
+
+    @property
+    def prompt_version(self) -> str:
+        return self._prompt.version
+
+    async def lookup(self, job_description: str) -> Optional[JobAnalysis]:
+        if not self._cache or not job_description.strip():
+            return None
+
+        fingerprint = job_fingerprint(job_description)
+        key = f"{KEY_PREFIX}:{self._prompt.version}:{fingerprint}"
+        seen_key = f"{SEEN_KEY_PREFIX}:{self._prompt.version}:{fingerprint}"
+        try:
+            cached, seen = await self._cache.get_many([key, seen_key])
+        except Exception as e:
+            logger.warning(f"Job analysis cache read failed: {e}")
+            return None
+
+        if cached is not None:
+            return JobAnalysis(**cached)
+
+        if seen is None:
+            try:
+                await self._cache.set(seen_key, 1, ttl_seconds=self._ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Job analysis cache write failed: {e}")
+            return None
+
+        if key not in self._pending:
+            task = asyncio.ensure_future(self._analyze_and_store(key, job_description))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return None
+
+    async def close(self) -> None:
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, job_description: str) -> JobAnalysis:
+        result = await self._llm.complete(
+            messages=[
+                LLMMessage(role="system", content=self._prompt.system),
+                LLMMessage(
+                    role="user",
+                    content=self._prompt.format_user(job_description=job_description),
+                ),
+            ],
+            temperature=self._prompt.temperature,
+            max_tokens=self._prompt.max_tokens,
+        )
+        return JobAnalysis(**self._parse_json(result.content))
+
+    async def _analyze_and_store(self, key: str, job_description: str) -> None:
+        try:
+            analysis = await self.run(job_description)
+            await self._cache.set(key, analysis.model_dump(), ttl_seconds=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Job analysis failed: {e}")
+
+    def _parse_json(self, content: str) -> dict:
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+        return json.loads(content)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
 
@@ -50,12 +50,17 @@ class OptimizationChain:
         self._llm = llm
         self._prompt = prompt_loader.load("optimization")
 
+    @property
+    def prompt_version(self) -> str:
+        return self._prompt.version
+
     async def run(
         self,
         resume_content: str,
         job_description: str,
         pivot_strategy: Optional[str] = None,
         transferable_skills: Optional[list[str]] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> OptimizationResult:
         pivot_instructions = ""
         if pivot_strategy:
@@ -106,17 +111,18 @@ CRÍTICO: O professional_summary DEVE ser TOTALMENTE NOVO!
             pivot_instructions=pivot_instructions,
         )
 
-        result = await self._llm.complete(
-            messages=[
+        response = await self._llm.generate(
+            [
                 LLMMessage(role="system", content=self._prompt.system),
                 LLMMessage(role="user", content=user_prompt),
             ],
             temperature=self._prompt.temperature,
             max_tokens=self._prompt.max_tokens,
+            on_token=on_token,
         )
 
         try:
-            content = self._parse_json(result.content)
+            content = self._parse_json(response)
             return OptimizationResult(**content)
         except Exception as e:
             logger.error(f"Failed to parse optimization: {e}")
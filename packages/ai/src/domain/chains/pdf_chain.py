@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Optional
 
 from domain.ports.outbound.pdf_renderer_port import PDFRendererPort, PDFRenderRequest
@@ -10,6 +11,13 @@ from application.services.language_service import LanguageService, Language
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PreparedPDF:
+    request: PDFRenderRequest
+    # False quando algum texto ficou sem tradução (falha do LLM).
+    complete: bool = True
+
+
 class PDFChain:
     def __init__(
         self,
@@ -19,9 +27,26 @@ class PDFChain:
         self._pdf = pdf_renderer
         self._language_service = language_service
 
+    @property
+    def enabled(self) -> bool:
+        return self._pdf is not None
+
+    async def prepare(self, language: Language) -> None:
+        if self._pdf:
+            await self._pdf.prepare("default", language)
+
     async def run(
         self, resume: OptimizedResume, job_description: Optional[str] = None, target_language: Optional[Language] = None
     ) -> Optional[str]:
+        prepared = await self.build_request(resume, job_description, target_language)
+        if prepared is None:
+            return None
+        return await self.render(prepared.request)
+
+    async def build_request(
+        self, resume: OptimizedResume, job_description: Optional[str] = None, target_language: Optional[Language] = None
+    ) -> Optional[PreparedPDF]:
+        """Dados do PDF já no idioma da vaga (traduzidos quando necessário)."""
         if not self._pdf:
             return None
 
@@ -33,13 +58,27 @@ class PDFChain:
                 language = language or "pt"
 
             pdf_data = self._build_pdf_data(resume)
+            complete = True
 
             if language == "en" and self._language_service:
-                pdf_data = await self._language_service.translate_resume_content(pdf_data, language)
+                pdf_data, complete = await self._language_service.translate_resume_content(
+                    pdf_data, language
+                )
 
-            result = await self._pdf.render_pdf(
-                PDFRenderRequest(resume=pdf_data, template_id="default", language=language)
+            return PreparedPDF(
+                PDFRenderRequest(resume=pdf_data, template_id="default", language=language),
+                complete=complete,
             )
+        except Exception as e:
+            logger.error(f"PDF generation failed: {e}")
+            return None
+
+    async def render(self, request: PDFRenderRequest) -> Optional[str]:
+        if not self._pdf:
+            return None
+
+        try:
+            result = await self._pdf.render_pdf(request)
             return f"/storage/{result.filename}"
         except Exception as e:
             logger.error(f"PDF generation failed: {e}")
@@ -1,16 +1,20 @@
 """Cache Port - Interface for caching."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 
 class CachePort(ABC):
     """
     Interface para cache.
     
+    Valores precisam ser serializáveis em JSON (dicts, listas, strings,
+    números); todos os adapters devolvem uma cópia desserializada, nunca o
+    objeto guardado.
+    
     Implementações:
-        - RedisAdapter
-        - MemoryAdapter (para testes)
+        - RedisCacheAdapter
+        - MemoryCacheAdapter (testes e deploys de um nó só)
     
     Exemplo:
         ```python
@@ -54,6 +58,39 @@ class CachePort(ABC):
         """
         pass
     
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        """
+        Obtém vários valores de uma vez.
+
+        A implementação padrão chama get() para cada chave; adapters
+        remotos devem sobrescrever para fazer uma única ida ao servidor.
+
+        Args:
+            keys: Chaves do cache
+
+        Returns:
+            Valores na mesma ordem das chaves (None para as ausentes)
+        """
+        return [await self.get(key) for key in keys]
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        """
+        Armazena vários valores de uma vez, todos com o mesmo TTL.
+
+        Args:
+            items: Mapa chave -> valor
+            ttl_seconds: Tempo de vida em segundos
+
+        Returns:
+            True se todos foram armazenados
+        """
+        results = [await self.set(key, value, ttl_seconds) for key, value in items.items()]
+        return all(results)
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """
@@ -103,3 +140,9 @@ class CachePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Libera os recursos do adapter no shutdown da aplicação.
+        """
+        pass
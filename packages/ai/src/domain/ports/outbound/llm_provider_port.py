@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Optional
 
 
 @dataclass(frozen=True)
@@ -140,6 +140,49 @@ class LLMProviderPort(ABC):
         """
         pass
     
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """
+        Gera a resposta completa, repassando os trechos a on_token quando informado.
+        
+        Sem on_token usa complete(); com on_token usa complete_stream() e
+        chama on_token com cada trecho conforme o modelo gera. Os trechos são
+        a saída bruta do modelo (ex.: o JSON ainda incompleto quando o prompt
+        pede JSON), sem nenhum parsing.
+        
+        Args:
+            messages: Lista de mensagens do contexto
+            temperature: Temperatura para geração
+            max_tokens: Máximo de tokens na resposta
+            on_token: Callback chamado com cada trecho gerado (opcional)
+            
+        Returns:
+            Conteúdo gerado
+        """
+        if on_token is None:
+            result = await self.complete(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            return result.content
+        
+        parts: list[str] = []
+        async for chunk in self.complete_stream(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ):
+            if chunk.content:
+                parts.append(chunk.content)
+                on_token(chunk.content)
+        return "".join(parts)
+    
     @abstractmethod
     def is_configured(self) -> bool:
         """
@@ -6,6 +6,29 @@ from pathlib import Path
 from typing import Any, Optional
 
 
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class PDFRenderError(Exception):
+    """Raised when PDF rendering fails."""
+
+    pass
+
+
+class PDFRenderBusyError(PDFRenderError):
+    """Raised when the renderer is saturated and cannot accept more work."""
+
+    pass
+
+
+class PDFRenderTimeoutError(PDFRenderError):
+    """Raised when a render does not finish within the configured timeout."""
+
+    pass
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -61,12 +84,14 @@ class PDFRenderResult:
         filepath: Full path to generated file
         template_used: Template ID that was used
         download_url: URL for downloading (if applicable)
+        cached: Whether the file was served from the render cache
     """
 
     filename: str
     filepath: str
     template_used: str
     download_url: Optional[str] = None
+    cached: bool = False
 
 
 @dataclass
@@ -122,6 +147,31 @@ class PDFRendererPort(ABC):
         """
         pass
 
+    async def render_pdf_bytes(self, request: PDFRenderRequest) -> bytes:
+        """
+        Renderiza um currículo como PDF e retorna o conteúdo em memória.
+
+        A implementação padrão renderiza em arquivo e lê de volta; adapters
+        que conseguem gerar direto em memória devem sobrescrever.
+
+        Args:
+            request: PDFRenderRequest com dados do currículo e opções
+
+        Returns:
+            Bytes do PDF gerado
+        """
+        result = await self.render_pdf(request)
+        with open(result.filepath, "rb") as f:
+            return f.read()
+
+    async def prepare(self, template_id: str = "default", language: str = "pt") -> None:
+        """
+        Deixa o template pronto para renderizar (compilado, workers ativos).
+
+        Pode ser chamado antes de o currículo existir, em paralelo a outras
+        etapas do pipeline. A implementação padrão não faz nada.
+        """
+
     @abstractmethod
     def get_available_templates(self) -> list[TemplateInfo]:
         """
@@ -157,12 +207,10 @@ class PDFRendererPort(ABC):
         """
         [LEGACY] Renderiza PDF e retorna como bytes.
 
-        Use render_pdf() and read the file instead.
+        Use render_pdf_bytes() instead.
         """
         request = PDFRenderRequest(resume=content, template_id=options.template_id)
-        result = await self.render_pdf(request)
-        with open(result.filepath, "rb") as f:
-            return f.read()
+        return await self.render_pdf_bytes(request)
 
     def template_exists(self, template_id: str) -> bool:
         """Verifica se um template existe."""
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
 
 @dataclass
@@ -32,11 +32,36 @@ class VectorSearchResult:
         document: Documento encontrado
         score: Score de similaridade (0-1)
         distance: Distância vetorial
+        fused_score: Score da busca híbrida (RRF), que define a ordem dos
+            resultados quando presente; score continua sendo a similaridade
     """
     
     document: VectorDocument
     score: float
     distance: float = 0.0
+    fused_score: Optional[float] = None
+
+
+def matches_filter(metadata: dict, filter_metadata: Optional[dict]) -> bool:
+    """
+    Semântica de filter_metadata para stores sem filtro nativo, igual ao
+    MatchValue do Qdrant: todas as chaves precisam casar, e um payload que
+    é lista casa se algum elemento for igual ao valor.
+    """
+    if not filter_metadata:
+        return True
+    return all(
+        _match_value(metadata.get(key), expected) for key, expected in filter_metadata.items()
+    )
+
+
+def _match_value(value: Any, expected: Any) -> bool:
+    if isinstance(value, list):
+        return any(_match_value(item, expected) for item in value)
+    # True == 1 em Python, mas o Qdrant não casa bool com inteiro.
+    if isinstance(value, bool) != isinstance(expected, bool):
+        return False
+    return value == expected
 
 
 class VectorStorePort(ABC):
@@ -48,8 +73,8 @@ class VectorStorePort(ABC):
     
     Implementações:
         - QdrantAdapter
-        - ChromaDBAdapter
-        - PineconeAdapter
+        - LocalVectorStoreAdapter (NumPy em processo)
+        - MirroredVectorStore (Qdrant + cópia local de collections quentes)
     
     Exemplo:
         ```python
@@ -93,6 +118,9 @@ class VectorStorePort(ABC):
         limit: int = 10,
         filter_metadata: Optional[dict] = None,
         query_vector: Optional[list[float]] = None,
+        score_threshold: Optional[float] = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
     ) -> list[VectorSearchResult]:
         """
         Busca documentos similares à query.
@@ -102,6 +130,10 @@ class VectorStorePort(ABC):
             collection_name: Nome da collection
             limit: Número máximo de resultados
             filter_metadata: Filtros de metadados
+            query_vector: Embedding da query
+            score_threshold: Score mínimo, aplicado no próprio vector store
+            payload_fields: Campos de metadados a retornar (None = todos)
+            include_content: Se False, retorna só IDs/metadados, sem o conteúdo
             
         Returns:
             Lista de resultados ordenados por similaridade
@@ -111,6 +143,74 @@ class VectorStorePort(ABC):
         """
         pass
     
+    async def existing_ids(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> set[str]:
+        """
+        Verifica quais IDs já estão armazenados.
+        
+        Usado para pular embedding e upsert de conteúdo já indexado.
+        A implementação padrão não conhece nenhum ID.
+        
+        Args:
+            document_ids: IDs a verificar
+            collection_name: Nome da collection
+            
+        Returns:
+            Subconjunto de document_ids que já existe
+        """
+        return set()
+    
+    async def payload_values(
+        self,
+        document_ids: list[str],
+        field: str,
+        collection_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Lê um campo do payload dos documentos que já estão armazenados.
+        
+        Usado para pular documentos cujo conteúdo e metadados não mudaram.
+        A implementação padrão não conhece nenhum ID.
+        
+        Args:
+            document_ids: IDs a verificar
+            field: Campo do payload a retornar
+            collection_name: Nome da collection
+            
+        Returns:
+            ID existente -> valor do campo (None se o campo não existir)
+        """
+        return {}
+    
+    async def get_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+        include_vectors: bool = False,
+    ) -> list[VectorDocument]:
+        """
+        Busca documentos armazenados pelo ID.
+        
+        IDs ausentes são ignorados. A implementação padrão não conhece
+        nenhum documento.
+        
+        Args:
+            document_ids: IDs a buscar
+            collection_name: Nome da collection
+            payload_fields: Campos de metadados a retornar (None = todos)
+            include_content: Se False, retorna só IDs/metadados, sem o conteúdo
+            include_vectors: Se True, preenche embedding
+            
+        Returns:
+            Documentos encontrados
+        """
+        return []
+    
     @abstractmethod
     async def delete_documents(
         self,
@@ -160,6 +260,29 @@ class VectorStorePort(ABC):
         """
         pass
     
+    def scroll_documents(
+        self,
+        collection_name: str | None = None,
+        batch_size: int = 256,
+        include_vectors: bool = True,
+    ) -> AsyncIterator[list[VectorDocument]]:
+        """
+        Percorre todos os documentos da collection em páginas.
+        
+        Args:
+            collection_name: Nome da collection
+            batch_size: Documentos por página
+            include_vectors: Se False, os documentos vêm sem embedding
+            
+        Raises:
+            NotImplementedError: Se o vector store não suporta listagem
+        """
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Libera conexões e persiste estado pendente, se houver."""
+        return None
+    
     @abstractmethod
     async def is_healthy(self) -> bool:
         """
@@ -1,31 +1,38 @@
+import json
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from domain.ports.outbound.llm_provider_port import LLMMessage
 from infrastructure.adapters.outbound.llm.openai_adapter import OpenAIAdapter
-from infrastructure.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter
-from infrastructure.adapters.outbound.pdf.weasyprint_adapter import WeasyPrintAdapter
-from application.services.embedding_service import EmbeddingService
-from application.services.rag_service import RAGService
-from application.services.chat_context_service import ChatContextService
+from application.services.chat_context_service import ChatContext, ChatContextService
 from application.services.resume_optimizer_chat_service import ResumeOptimizerChatService
 from infrastructure.config import get_settings
+from infrastructure.container import (
+    get_cache,
+    get_pdf_renderer,
+    get_pipeline_result_cache,
+    get_translation_memory,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/chat", tags=["Chat"])
 
 settings = get_settings()
 llm_adapter = OpenAIAdapter()
-pdf_adapter = WeasyPrintAdapter()
+pdf_adapter = get_pdf_renderer()
 chat_context_service = ChatContextService()
-optimizer_service = ResumeOptimizerChatService(llm_adapter, pdf_adapter)
-
-vector_store = QdrantAdapter()
-embedding_service = EmbeddingService()
-rag_service = RAGService(vector_store, embedding_service)
+optimizer_service = ResumeOptimizerChatService(
+    llm_adapter,
+    pdf_adapter,
+    result_cache=get_pipeline_result_cache(),
+    cache=get_cache(),
+    job_analysis_ttl_seconds=int(settings.job_analysis_cache_ttl_hours * 3600),
+    translation_memory=get_translation_memory(),
+)
 
 
 class ChatMessage(BaseModel):
@@ -38,6 +45,8 @@ class ChatCompletionRequest(BaseModel):
     user_id: Optional[str] = None
     temperature: float = Field(default=0.7, ge=0, le=2)
     max_tokens: int = Field(default=2000, ge=1, le=4000)
+    # Ignora o resultado em cache e gera a otimização de novo.
+    regenerate: bool = False
 
 
 class ChatCompletionResponse(BaseModel):
@@ -66,7 +75,9 @@ async def chat_completion(request: ChatCompletionRequest):
 
         if context.is_optimization_request:
             logger.info("Detected optimization request - generating optimized resume")
-            result = await optimizer_service.process_optimization(context, messages_dict)
+            result = await optimizer_service.process_optimization(
+                context, messages_dict, bypass_cache=request.regenerate
+            )
             return ChatCompletionResponse(
                 content=result.content,
                 model=result.model,
@@ -105,19 +116,23 @@ async def chat_completion_stream(request: ChatCompletionRequest):
             detail="AI service not configured",
         )
 
-    from fastapi.responses import StreamingResponse
+    messages_dict = [{"role": m.role, "content": m.content} for m in request.messages]
+    context = chat_context_service.analyze_context(messages_dict)
+
+    if context.is_optimization_request:
+        logger.info("Detected optimization request - streaming pipeline progress")
+        return StreamingResponse(
+            _stream_optimization(context, messages_dict, request.regenerate),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     async def generate_stream():
         try:
-            messages_dict = [{"role": m.role, "content": m.content} for m in request.messages]
-            context = chat_context_service.analyze_context(messages_dict)
             llm_messages = chat_context_service.build_messages_with_context(
                 messages_dict, context
             )
 
-            if context.is_optimization_request:
-                logger.info("Detected optimization request - using optimizer prompt")
-
             async for chunk in llm_adapter.complete_stream(
                 llm_messages,
                 temperature=request.temperature,
@@ -132,3 +147,22 @@ async def chat_completion_stream(request: ChatCompletionRequest):
 
     return StreamingResponse(generate_stream(), media_type="text/event-stream")
 
+
+@router.get("/translation/stats")
+async def translation_stats():
+    return optimizer_service.translation_stats
+
+
+async def _stream_optimization(
+    context: ChatContext, messages_dict: list[dict], regenerate: bool
+):
+    async for event in optimizer_service.stream_optimization(
+        context, messages_dict, bypass_cache=regenerate
+    ):
+        name = event.pop("event")
+        if name == "heartbeat":
+            # Comentário SSE: mantém a conexão viva sem gerar evento no cliente.
+            yield ": heartbeat\n\n"
+            continue
+        yield f"event: {name}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    yield "data: [DONE]\n\n"
@@ -1,22 +1,36 @@
+import asyncio
+import codecs
+import json
 import logging
-from typing import Optional
+import tempfile
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.datastructures import UploadFile
 
-from infrastructure.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter
-from application.services.embedding_service import EmbeddingService
-from application.services.rag_service import RAGService
+from application.services.knowledge_ingestion_service import is_valid_job_id
 from infrastructure.config import get_settings
+from infrastructure.container import (
+    get_embedding_service,
+    get_knowledge_ingestion_service,
+    get_rag_service,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/knowledge", tags=["Knowledge"])
 
 settings = get_settings()
-vector_store = QdrantAdapter()
-embedding_service = EmbeddingService()
-rag_service = RAGService(vector_store, embedding_service)
+embedding_service = get_embedding_service()
+rag_service = get_rag_service()
+ingestion_service = get_knowledge_ingestion_service()
+
+# Corpos até esse tamanho ficam em memória; acima disso vão para disco.
+BULK_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+BULK_READ_CHUNK_BYTES = 1024 * 1024
 
 
 class AddKnowledgeRequest(BaseModel):
@@ -35,6 +49,8 @@ class SearchKnowledgeRequest(BaseModel):
     collection_name: Optional[str] = None
     limit: int = Field(default=5, ge=1, le=20)
     min_score: float = Field(default=0.7, ge=0, le=1)
+    fields: Optional[list[str]] = None
+    include_content: bool = True
 
 
 class KnowledgeDocument(BaseModel):
@@ -42,6 +58,7 @@ class KnowledgeDocument(BaseModel):
     content: str
     metadata: dict
     score: float
+    fused_score: Optional[float] = None
 
 
 class SearchKnowledgeResponse(BaseModel):
@@ -58,13 +75,9 @@ async def add_knowledge(request: AddKnowledgeRequest):
         )
 
     try:
-        metadata = request.metadata.copy()
-        if "id" not in metadata:
-            metadata["id"] = str(uuid4())
-
         doc_id = await rag_service.add_knowledge(
             content=request.content,
-            metadata=metadata,
+            metadata=request.metadata.copy(),
             collection_name=request.collection_name,
         )
 
@@ -80,6 +93,78 @@ async def add_knowledge(request: AddKnowledgeRequest):
         )
 
 
+@router.post("/bulk")
+async def bulk_add_knowledge(
+    request: Request,
+    collection_name: Optional[str] = None,
+    job_id: Optional[str] = None,
+):
+    """
+    Ingestão em massa via JSONL (corpo cru ou upload multipart no campo "file").
+
+    Responde com eventos NDJSON de progresso. Reenviar o mesmo arquivo com o
+    mesmo job_id retoma a partir do último checkpoint.
+    """
+    if not embedding_service.is_configured():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Embedding service not configured",
+        )
+
+    job_id = job_id or uuid4().hex
+    if not is_valid_job_id(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="job_id must match [A-Za-z0-9_-]{1,64}",
+        )
+
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if not isinstance(upload, UploadFile):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Multipart upload must include a 'file' field",
+            )
+        read = upload.read
+        close = upload.close
+    else:
+        # Acima de BULK_SPOOL_MAX_BYTES o spool vai para disco: escritas e
+        # leituras rodam em thread para não travar o event loop.
+        spool = tempfile.SpooledTemporaryFile(max_size=BULK_SPOOL_MAX_BYTES)
+        try:
+            async for chunk in request.stream():
+                await asyncio.to_thread(spool.write, chunk)
+            await asyncio.to_thread(spool.seek, 0)
+        except BaseException:
+            spool.close()
+            raise
+        read = partial(asyncio.to_thread, spool.read)
+        close = partial(asyncio.to_thread, spool.close)
+
+    async def generate_stream():
+        try:
+            async for event in ingestion_service.ingest(_iter_lines(read), job_id, collection_name):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            await close()
+
+    return StreamingResponse(generate_stream(), media_type="application/x-ndjson")
+
+
+async def _iter_lines(read: Callable[[int], Awaitable[bytes]]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    while chunk := await read(BULK_READ_CHUNK_BYTES):
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
 @router.post("/search", response_model=SearchKnowledgeResponse)
 async def search_knowledge(request: SearchKnowledgeRequest):
     if not embedding_service.is_configured():
@@ -94,6 +179,8 @@ async def search_knowledge(request: SearchKnowledgeRequest):
             collection_name=request.collection_name,
             limit=request.limit,
             min_score=request.min_score,
+            payload_fields=request.fields,
+            include_content=request.include_content,
         )
 
         knowledge_docs = [
@@ -102,6 +189,7 @@ async def search_knowledge(request: SearchKnowledgeRequest):
                 content=r.document.content,
                 metadata=r.document.metadata,
                 score=r.score,
+                fused_score=r.fused_score,
             )
             for r in results
         ]
@@ -118,13 +206,18 @@ async def search_knowledge(request: SearchKnowledgeRequest):
         )
 
 
+@router.get("/embeddings/stats")
+async def embedding_cache_stats():
+    return embedding_service.cache_stats
+
+
 @router.delete("/documents/{document_id}")
 async def delete_knowledge(
     document_id: str,
     collection_name: Optional[str] = None,
 ):
     try:
-        deleted_count = await vector_store.delete_documents(
+        deleted_count = await rag_service.delete_knowledge(
             document_ids=[document_id],
             collection_name=collection_name,
         )
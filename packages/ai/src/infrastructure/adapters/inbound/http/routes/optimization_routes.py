@@ -18,20 +18,19 @@ from application.dto.optimization_dto import (
 )
 from application.use_cases.optimize_resume_use_case import OptimizeResumeUseCase
 from domain.ports.outbound.llm_provider_port import LLMMessage
+from domain.ports.outbound.pdf_renderer_port import (
+    PDFRenderBusyError,
+    PDFRenderTimeoutError,
+)
 from infrastructure.adapters.outbound.llm import OpenAIAdapter
-from infrastructure.adapters.outbound.pdf import WeasyPrintAdapter
-from infrastructure.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter
-from application.services.embedding_service import EmbeddingService
-from application.services.rag_service import RAGService
+from infrastructure.container import get_pdf_renderer, get_rag_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/resumes", tags=["Resume Optimization"])
 
 llm_adapter = OpenAIAdapter()
-pdf_adapter = WeasyPrintAdapter()
-vector_store = QdrantAdapter()
-embedding_service = EmbeddingService()
-rag_service = RAGService(vector_store, embedding_service)
+pdf_adapter = get_pdf_renderer()
+rag_service = get_rag_service()
 optimize_use_case = OptimizeResumeUseCase(llm_adapter, pdf_adapter, rag_service)
 
 
@@ -113,6 +112,16 @@ async def optimize_resume(request: OptimizationRequestSchema):
 
     except HTTPException:
         raise
+    except PDFRenderBusyError as e:
+        logger.warning(f"Optimization PDF rejected: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    except PDFRenderTimeoutError as e:
+        logger.error(f"Optimization PDF timed out: {e}")
+        raise HTTPException(status_code=504, detail=f"PDF generation timed out: {e}")
     except Exception as e:
         logger.error(f"Optimization failed: {e}")
         raise HTTPException(status_code=500, detail=f"Optimization failed: {e}")
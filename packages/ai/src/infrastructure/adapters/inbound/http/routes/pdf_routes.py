@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import json
 import logging
+import re
 from pathlib import Path
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from infrastructure.adapters.outbound.pdf import WeasyPrintAdapter
-from domain.ports.outbound.pdf_renderer_port import PDFRenderRequest
+from domain.ports.outbound.pdf_renderer_port import (
+    PDFRenderBusyError,
+    PDFRenderRequest,
+    PDFRenderTimeoutError,
+)
+from infrastructure.container import get_pdf_renderer
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/pdf", tags=["PDF Generation"])
 
-pdf_adapter = WeasyPrintAdapter()
+pdf_adapter = get_pdf_renderer()
+
+_ENTITY_TAG = re.compile(r'(?:W/)?"[^"]*"')
 
 
 class ContactInfoSchema(BaseModel):
@@ -88,6 +96,12 @@ class GeneratePDFRequest(BaseModel):
     template_id: str = "default"
 
 
+class BatchGeneratePDFRequest(BaseModel):
+    items: list[GeneratePDFRequest] = Field(..., min_length=1, max_length=500)
+    format: Literal["ndjson", "sse"] = "ndjson"
+    zip: bool = False
+
+
 class PDFResponse(BaseModel):
     filename: str
     download_url: str
@@ -121,18 +135,158 @@ async def generate_pdf(request: GeneratePDFRequest):
         )
 
     except Exception as e:
-        logger.error(f"PDF generation failed: {e}")
-        raise HTTPException(status_code=500, detail=f"PDF generation failed: {e}")
+        raise _to_http_error(e) from e
+
+
+@router.post("/generate/stream")
+async def generate_pdf_stream(request: GeneratePDFRequest):
+    """Retorna o PDF diretamente no corpo da resposta, sem passar pelo storage."""
+    render_request = PDFRenderRequest(
+        resume=request.resume.model_dump(),
+        template_id=request.template_id,
+    )
+
+    try:
+        rendered = await pdf_adapter.render_pdf_content(render_request)
+    except Exception as e:
+        raise _to_http_error(e) from e
+
+    return Response(
+        content=rendered.content,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{rendered.filename}"'},
+    )
+
+
+@router.post("/preview", response_class=HTMLResponse)
+async def preview_pdf(
+    request: GeneratePDFRequest,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """HTML do template sem passar pelo WeasyPrint, para o preview ao vivo."""
+    render_request = PDFRenderRequest(
+        resume=request.resume.model_dump(),
+        template_id=request.template_id,
+    )
+
+    try:
+        preview = pdf_adapter.plan_preview(render_request)
+        headers = {"Cache-Control": "no-cache"}
+        if preview.etag:
+            headers["ETag"] = preview.etag
+            if if_none_match and _etag_matches(if_none_match, preview.etag):
+                return Response(status_code=304, headers=headers)
+
+        html_content = pdf_adapter.render_html(preview)
+        return HTMLResponse(content=html_content, headers=headers)
+    except Exception as e:
+        logger.error(f"PDF preview failed: {e}")
+        raise HTTPException(status_code=500, detail=f"PDF preview failed: {e}") from e
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match usa comparação fraca (RFC 9110): W/"x" casa com "x".
+    if if_none_match.strip() == "*":
+        return True
+    candidates = _ENTITY_TAG.findall(if_none_match)
+    return _strip_weak(etag) in {_strip_weak(tag) for tag in candidates}
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _to_http_error(e: Exception) -> HTTPException:
+    if isinstance(e, PDFRenderBusyError):
+        logger.warning(f"PDF generation rejected: {e}")
+        return HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    if isinstance(e, PDFRenderTimeoutError):
+        logger.error(f"PDF generation timed out: {e}")
+        return HTTPException(status_code=504, detail=f"PDF generation timed out: {e}")
+    logger.error(f"PDF generation failed: {e}")
+    return HTTPException(status_code=500, detail=f"PDF generation failed: {e}")
+
+
+@router.post("/generate/batch")
+async def generate_pdf_batch(request: BatchGeneratePDFRequest):
+    render_requests = [
+        PDFRenderRequest(resume=item.resume.model_dump(), template_id=item.template_id)
+        for item in request.items
+    ]
+
+    def encode(event: str, payload: dict) -> str:
+        data = json.dumps(payload, ensure_ascii=False)
+        if request.format == "sse":
+            return f"event: {event}\ndata: {data}\n\n"
+        return f"{data}\n"
+
+    async def generate_stream():
+        filenames: dict[int, str] = {}
+
+        async for index, result in pdf_adapter.render_many(render_requests):
+            if isinstance(result, Exception):
+                logger.error(f"Batch PDF item {index} failed: {result}")
+                yield encode("item", {"index": index, "status": "error", "error": str(result)})
+                continue
+
+            filenames[index] = result.filename
+            yield encode(
+                "item",
+                {
+                    "index": index,
+                    "status": "ok",
+                    "filename": result.filename,
+                    "download_url": f"/api/v1/pdf/files/{result.filename}",
+                    "template_used": result.template_used,
+                    "cached": result.cached,
+                },
+            )
+
+        summary: dict = {
+            "status": "complete",
+            "total": len(render_requests),
+            "succeeded": len(filenames),
+            "failed": len(render_requests) - len(filenames),
+        }
+
+        if request.zip and filenames:
+            try:
+                archive = await pdf_adapter.create_archive(
+                    [(filenames[i], render_requests[i]) for i in sorted(filenames)]
+                )
+                summary["zip_url"] = f"/api/v1/pdf/files/{archive.filename}"
+                if archive.skipped:
+                    summary["zip_skipped"] = archive.skipped
+            except Exception as e:
+                logger.error(f"Batch archive failed: {e}")
+                summary["zip_error"] = str(e)
+
+        yield encode("complete", summary)
+
+    media_type = "text/event-stream" if request.format == "sse" else "application/x-ndjson"
+    return StreamingResponse(generate_stream(), media_type=media_type)
+
+
+DOWNLOAD_MEDIA_TYPES = {".pdf": "application/pdf", ".zip": "application/zip"}
 
 
 @router.get("/files/{filename}")
 async def download_pdf(filename: str):
+    # Só serve artefatos finalizados na raiz do storage (nunca temporários).
+    media_type = DOWNLOAD_MEDIA_TYPES.get(Path(filename).suffix)
+    if Path(filename).name != filename or media_type is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
     filepath = Path("storage") / filename
 
     if not filepath.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(path=str(filepath), media_type="application/pdf", filename=filename)
+    return FileResponse(path=str(filepath), media_type=media_type, filename=filename)
 
 
 @router.get("/templates", response_model=TemplatesListResponse)
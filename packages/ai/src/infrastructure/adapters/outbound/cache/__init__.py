@@ -0,0 +1,7 @@
+"""Cache adapters."""
+
+from .memory_cache import MemoryCacheAdapter
+from .redis_cache import RedisCacheAdapter
+from .sqlite_cache import SqliteCacheAdapter
+
+__all__ = ["MemoryCacheAdapter", "RedisCacheAdapter", "SqliteCacheAdapter"]
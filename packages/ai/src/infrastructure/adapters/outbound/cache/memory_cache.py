@@ -0,0 +1,71 @@
+"""In-process LRU/TTL implementation of CachePort."""
+
+from __future__ import annotations
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import orjson
+
+from domain.ports.outbound.cache_port import CachePort
+
+
+class MemoryCacheAdapter(CachePort):
+    """
+    Cache em memória do processo, limitado por número de entradas (LRU)
+    e com expiração por entrada. Serve para testes e deploys de um nó só.
+    Os valores passam pelo mesmo orjson do Redis: cada get devolve uma cópia
+    nova, e tuplas, datetimes etc. voltam como nos outros backends.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return orjson.loads(value)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        if ttl_seconds <= 0:
+            return False
+
+        self._entries[key] = (time.monotonic() + ttl_seconds, orjson.dumps(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def clear_pattern(self, pattern: str) -> int:
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def is_healthy(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        self._entries.clear()
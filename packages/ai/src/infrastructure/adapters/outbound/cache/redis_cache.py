@@ -0,0 +1,141 @@
+"""Redis implementation of CachePort with orjson-encoded values."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Optional, Sequence
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from domain.ports.outbound.cache_port import CachePort
+
+logger = logging.getLogger(__name__)
+
+# Após uma falha o Redis fica desligado por um tempo e o cache responde
+# como vazio, em vez de cada chamada esperar o timeout de conexão.
+REDIS_COOLDOWN_SECONDS = 30.0
+
+SCAN_BATCH_SIZE = 500
+
+
+class RedisCacheAdapter(CachePort):
+    """
+    Cache compartilhado entre instâncias sobre um cliente Redis com pool.
+
+    Valores são serializados com orjson (dicts, listas, strings e números).
+    Operações em lote usam MGET e pipelines sem transação; clear_pattern
+    percorre as chaves com SCAN em vez de KEYS para não travar o servidor.
+    O cliente é compartilhado e fechado por quem o criou.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+        self._disabled_until = 0.0
+
+    async def get(self, key: str) -> Optional[Any]:
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        if not keys or not self._available():
+            return [None] * len(keys)
+
+        try:
+            values = await self._redis.mget(list(keys))
+        except RedisError as e:
+            self._disable(e)
+            return [None] * len(keys)
+
+        return [self._decode(key, data) for key, data in zip(keys, values)]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        return await self.set_many({key: value}, ttl_seconds)
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        if not items or ttl_seconds <= 0 or not self._available():
+            return False
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, orjson.dumps(value), ex=ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            self._disable(e)
+            return False
+        return True
+
+    async def delete(self, key: str) -> bool:
+        if not self._available():
+            return False
+        try:
+            return await self._redis.unlink(key) > 0
+        except RedisError as e:
+            self._disable(e)
+            return False
+
+    async def exists(self, key: str) -> bool:
+        if not self._available():
+            return False
+        try:
+            return await self._redis.exists(key) > 0
+        except RedisError as e:
+            self._disable(e)
+            return False
+
+    async def clear_pattern(self, pattern: str) -> int:
+        if not self._available():
+            return 0
+
+        removed = 0
+        batch: list[bytes] = []
+        try:
+            async for key in self._redis.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    removed += await self._redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                removed += await self._redis.unlink(*batch)
+        except RedisError as e:
+            self._disable(e)
+        return removed
+
+    async def is_healthy(self) -> bool:
+        try:
+            return bool(await self._redis.ping())
+        except RedisError:
+            return False
+
+    async def close(self) -> None:
+        # O cliente é compartilhado (get_redis) e fechado no shutdown por quem o criou.
+        pass
+
+    def _decode(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Discarding undecodable cache entry: {key}")
+            return None
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(
+            f"Redis cache unavailable ({error}), retrying in {REDIS_COOLDOWN_SECONDS:.0f}s"
+        )
+        self._disabled_until = time.monotonic() + REDIS_COOLDOWN_SECONDS
@@ -0,0 +1,130 @@
+"""SQLite implementation of CachePort for single-node persistent caches."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import orjson
+
+from domain.ports.outbound.cache_port import CachePort
+
+logger = logging.getLogger(__name__)
+
+# Limite de parâmetros por consulta (SQLITE_MAX_VARIABLE_NUMBER antigo).
+QUERY_BATCH_SIZE = 500
+
+
+class SqliteCacheAdapter(CachePort):
+    """
+    Cache persistente em um arquivo SQLite local.
+
+    Para caches que precisam sobreviver a reinícios sem Redis, em deploys de
+    um nó só. Valores são serializados com orjson, como no Redis; a expiração
+    usa o relógio de parede, entradas vencidas são ignoradas na leitura e
+    removidas ao abrir o arquivo. Todo acesso ao disco roda em uma thread,
+    fora do event loop.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[Any]:
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        if not keys:
+            return []
+        found = await asyncio.to_thread(self._select, list(keys))
+        return [self._decode(key, found.get(key)) for key in keys]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        return await self.set_many({key: value}, ttl_seconds)
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl_seconds: int = 3600,
+    ) -> bool:
+        if not items or ttl_seconds <= 0:
+            return False
+
+        expires_at = time.time() + ttl_seconds
+        rows = [(key, orjson.dumps(value), expires_at) for key, value in items.items()]
+        await asyncio.to_thread(
+            self._write,
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            rows,
+        )
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return await asyncio.to_thread(self._write, "DELETE FROM cache WHERE key = ?", [(key,)]) > 0
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def clear_pattern(self, pattern: str) -> int:
+        # GLOB tem os mesmos curingas (*, ?, [...]) dos padrões do Redis.
+        return await asyncio.to_thread(
+            self._write, "DELETE FROM cache WHERE key GLOB ?", [(pattern,)]
+        )
+
+    async def is_healthy(self) -> bool:
+        try:
+            await asyncio.to_thread(self._select, [])
+            return True
+        except sqlite3.Error:
+            return False
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _select(self, keys: list[str]) -> dict[str, bytes]:
+        now = time.time()
+        found: dict[str, bytes] = {}
+        with self._lock:
+            if not keys:
+                self._conn.execute("SELECT 1").fetchone()
+            for start in range(0, len(keys), QUERY_BATCH_SIZE):
+                batch = keys[start : start + QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({placeholders}) AND expires_at > ?",
+                    (*batch, now),
+                )
+                found.update(rows)
+        return found
+
+    def _write(self, statement: str, rows: list[tuple]) -> int:
+        with self._lock, self._conn:
+            return self._conn.executemany(statement, rows).rowcount
+
+    def _decode(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Discarding undecodable cache entry: {key}")
+            return None
@@ -0,0 +1,78 @@
+"""Periodic cleanup of expired PDF artifacts in the storage directory."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from infrastructure.adapters.outbound.pdf.render_cache import PDFRenderCache
+from infrastructure.adapters.outbound.pdf.render_pool import TMP_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+# Temporários mais antigos que isso são restos de workers que morreram.
+ORPHAN_TMP_MAX_AGE_SECONDS = 3600
+
+
+class ArtifactSweeper:
+    """
+    Remove PDFs sem acesso há mais de max_age_seconds.
+
+    Hits do render cache atualizam o mtime, então apenas artefatos
+    realmente abandonados expiram.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        max_age_seconds: float,
+        interval_seconds: float,
+        render_cache: Optional[PDFRenderCache] = None,
+    ) -> None:
+        self._storage_dir = storage_dir
+        self._max_age = max_age_seconds
+        self._interval = interval_seconds
+        self._render_cache = render_cache
+
+    def sweep(self) -> list[str]:
+        now = time.time()
+        removed: list[str] = []
+
+        for path in self._storage_dir.iterdir():
+            if not path.is_file():
+                continue
+
+            if path.name.endswith(TMP_SUFFIX):
+                max_age = ORPHAN_TMP_MAX_AGE_SECONDS
+            elif path.suffix in (".pdf", ".zip"):
+                max_age = self._max_age
+            else:
+                continue
+
+            try:
+                if now - path.stat().st_mtime < max_age:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+
+            removed.append(path.name)
+
+        if removed:
+            logger.info(f"Artifact sweeper removed {len(removed)} files from {self._storage_dir}")
+        return removed
+
+    async def run(self) -> None:
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.sweep)
+                # O índice do cache só é alterado no event loop.
+                if self._render_cache is not None:
+                    for filename in removed:
+                        self._render_cache.discard(filename)
+            except Exception as e:
+                logger.error(f"Artifact sweep failed: {e}")
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,155 @@
+"""Content-addressed cache of rendered PDFs stored in the storage directory."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_PREFIX = "resume_"
+CACHE_FILE_SUFFIX = ".pdf"
+
+
+def canonicalize_resume(resume: Any) -> Optional[dict]:
+    if isinstance(resume, dict):
+        return resume
+    if hasattr(resume, "model_dump"):
+        return resume.model_dump()
+    return None
+
+
+def build_render_key(
+    resume: dict,
+    template_id: str,
+    language: str,
+    template_fingerprint: str,
+) -> str:
+    payload = json.dumps(
+        {
+            "resume": resume,
+            "template_id": template_id,
+            "language": language,
+            "template": template_fingerprint,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _touch(path: Path) -> Optional[int]:
+    """Atualiza o mtime do arquivo e retorna o tamanho, ou None se não existe."""
+    try:
+        os.utime(path)
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+class PDFRenderCache:
+    """
+    Índice LRU dos PDFs renderizados em storage/.
+
+    O nome do arquivo é derivado do hash do request, então um hit é apenas
+    uma verificação de existência. O mtime do arquivo é atualizado a cada hit
+    (em uma thread, fora do event loop) para que a ordem LRU sobreviva a
+    reinicializações.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_files: int = 5000,
+    ) -> None:
+        self._storage_dir = storage_dir
+        self._max_bytes = max_bytes
+        self._max_files = max_files
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._load_index()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+        }
+
+    async def lookup(self, filename: str) -> Optional[Path]:
+        path = self._storage_dir / filename
+        size = await asyncio.to_thread(_touch, path)
+        if size is None:
+            self._forget(filename)
+            self._misses += 1
+            return None
+
+        # Pode ter sido renderizado por outro worker do uvicorn.
+        if filename not in self._entries:
+            self._track(filename, size)
+        self._entries.move_to_end(filename)
+        self._hits += 1
+        return path
+
+    def add(self, filename: str) -> None:
+        try:
+            size = (self._storage_dir / filename).stat().st_size
+        except FileNotFoundError:
+            return
+        self._forget(filename)
+        self._track(filename, size)
+        self._evict()
+
+    def discard(self, filename: str) -> None:
+        self._forget(filename)
+
+    def _load_index(self) -> None:
+        files = []
+        for path in self._storage_dir.glob(f"{CACHE_FILE_PREFIX}*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, path.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._track(name, size)
+        self._evict()
+
+    def _track(self, filename: str, size: int) -> None:
+        self._entries[filename] = size
+        self._total_bytes += size
+
+    def _forget(self, filename: str) -> None:
+        size = self._entries.pop(filename, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        evicted = 0
+        while self._entries and (
+            self._total_bytes > self._max_bytes or len(self._entries) > self._max_files
+        ):
+            filename, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                (self._storage_dir / filename).unlink()
+            except FileNotFoundError:
+                pass
+            evicted += 1
+
+        if evicted:
+            logger.info(f"PDF cache evicted {evicted} files ({self._total_bytes} bytes kept)")
@@ -0,0 +1,231 @@
+"""Bounded process pool that keeps WeasyPrint off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Sequence
+
+from domain.ports.outbound.pdf_renderer_port import (
+    PDFRenderBusyError,
+    PDFRenderError,
+    PDFRenderTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+TMP_SUFFIX = ".tmp"
+
+
+# Estado por processo worker: fontconfig e folhas de estilo já parseadas.
+_font_config: Any = None
+_stylesheets: dict[str, tuple[str, Any]] = {}
+
+
+def _init_worker(stylesheets: Sequence[tuple[str, str]] = ()) -> None:
+    # Importa o WeasyPrint e descobre as fontes uma única vez por processo.
+    global _font_config
+    from weasyprint.text.fonts import FontConfiguration
+
+    _font_config = FontConfiguration()
+    for path, version in stylesheets:
+        try:
+            _get_stylesheet(path, version)
+        except Exception as e:
+            logger.warning(f"Failed to preload stylesheet {path}: {e}")
+
+
+def _get_stylesheet(path: str, version: str) -> Any:
+    cached = _stylesheets.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    from weasyprint import CSS
+
+    css = CSS(filename=path, font_config=_font_config)
+    _stylesheets[path] = (version, css)
+    return css
+
+
+def _build_document(html_content: str, base_url: str, stylesheet: Optional[tuple[str, str]]):
+    from weasyprint import HTML
+
+    stylesheets = [_get_stylesheet(*stylesheet)] if stylesheet else []
+    return HTML(string=html_content, base_url=base_url), stylesheets
+
+
+def _write_pdf(
+    html_content: str,
+    base_url: str,
+    stylesheet: Optional[tuple[str, str]],
+    output_path: str,
+) -> None:
+    # Escreve em arquivo temporário e renomeia: quem lê o destino nunca
+    # encontra um PDF parcialmente escrito.
+    directory, name = os.path.split(output_path)
+    tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}{TMP_SUFFIX}")
+
+    html_doc, stylesheets = _build_document(html_content, base_url, stylesheet)
+    try:
+        html_doc.write_pdf(tmp_path, stylesheets=stylesheets, font_config=_font_config)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _render_pdf_bytes(
+    html_content: str,
+    base_url: str,
+    stylesheet: Optional[tuple[str, str]],
+) -> bytes:
+    html_doc, stylesheets = _build_document(html_content, base_url, stylesheet)
+    return html_doc.write_pdf(stylesheets=stylesheets, font_config=_font_config)
+
+
+def _noop() -> None:
+    return None
+
+
+class PDFRenderPool:
+    """
+    Executa renderizações em um ProcessPoolExecutor limitado.
+
+    - max_workers: processos renderizando em paralelo
+    - max_queue: renderizações aguardando um processo livre; acima disso
+      submit() falha imediatamente com PDFRenderBusyError (backpressure)
+    - timeout_seconds: tempo máximo de execução de uma renderização, sem
+      contar a espera na fila
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        timeout_seconds: float = 60.0,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._max_queue = max(0, max_queue)
+        self._timeout = timeout_seconds
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight = 0
+        self._slots = asyncio.Semaphore(self._max_workers)
+        self._preload_stylesheets: list[tuple[str, str]] = []
+
+    @property
+    def capacity(self) -> int:
+        return self._max_workers + self._max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def is_saturated(self) -> bool:
+        return self._in_flight >= self.capacity
+
+    async def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.is_saturated():
+            raise PDFRenderBusyError(
+                f"PDF render queue is full ({self._in_flight}/{self.capacity})"
+            )
+
+        # A fila fica aqui, e não dentro do executor: só entra no executor
+        # quem tem um processo livre, então o timeout mede só a execução.
+        self._in_flight += 1
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            self._in_flight -= 1
+            raise
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release_slot()
+            raise
+
+        # O slot só é liberado quando o processo termina de fato: um render
+        # que estourou o timeout continua ocupando o worker até acabar.
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_slot))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        except asyncio.TimeoutError as e:
+            # O processo não pode ser interrompido; o resultado é descartado.
+            raise PDFRenderTimeoutError(
+                f"PDF render exceeded {self._timeout:.0f}s"
+            ) from e
+        except BrokenProcessPool as e:
+            logger.error("PDF render worker crashed, recreating pool")
+            self._reset_executor()
+            raise PDFRenderError("PDF render worker crashed") from e
+
+    async def write_pdf(
+        self,
+        html_content: str,
+        base_url: str,
+        stylesheet: Optional[tuple[str, str]],
+        output_path: str,
+    ) -> None:
+        """stylesheet: (caminho, versão) — a versão invalida o CSS em cache no worker."""
+        await self.submit(_write_pdf, html_content, base_url, stylesheet, output_path)
+
+    async def render_bytes(
+        self,
+        html_content: str,
+        base_url: str,
+        stylesheet: Optional[tuple[str, str]],
+    ) -> bytes:
+        return await self.submit(_render_pdf_bytes, html_content, base_url, stylesheet)
+
+    def preload_stylesheets(self, stylesheets: Sequence[tuple[str, str]]) -> None:
+        # Aplicado aos workers criados a partir de agora.
+        self._preload_stylesheets = list(stylesheets)
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    async def start(self) -> None:
+        executor = self._get_executor()
+        futures = [executor.submit(_noop) for _ in range(self._max_workers)]
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Criado sob demanda para que importar as rotas não crie processos.
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._preload_stylesheets,),
+            )
+            logger.info(f"PDF render pool started with {self._max_workers} workers")
+        return self._executor
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._slots.release()
+
+    def _reset_executor(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,116 @@
+"""Precompiled Jinja templates and stylesheet metadata per template/language."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    template: Template
+    base_dir: Path
+    template_file: Path
+    stylesheet_file: Path
+    stylesheet_source: Optional[str]
+    fingerprint: str
+
+    @property
+    def stylesheet_path(self) -> Optional[Path]:
+        return self.stylesheet_file if self.stylesheet_source is not None else None
+
+
+def _file_version(path: Path) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class TemplateCache:
+    """
+    Mantém templates Jinja compilados e o CSS de cada template/idioma.
+
+    Com auto_reload (desenvolvimento) o mtime dos arquivos é verificado a
+    cada acesso e a entrada é recompilada quando muda; em produção a
+    entrada compilada é usada sem tocar o disco.
+    """
+
+    def __init__(self, jinja_env: Environment, templates_dir: Path, auto_reload: bool = False) -> None:
+        self._env = jinja_env
+        self._templates_dir = templates_dir
+        self._auto_reload = auto_reload
+        self._entries: dict[tuple[str, str], CompiledTemplate] = {}
+
+    def get(
+        self,
+        template_id: str,
+        language: str,
+        template_file: str,
+        styles_file: str,
+    ) -> CompiledTemplate:
+        key = (template_id, language)
+        entry = self._entries.get(key)
+
+        if entry is None or (self._auto_reload and self._is_stale(entry)):
+            if entry is not None:
+                logger.info(f"Template changed on disk, reloading {template_id}/{language}")
+            entry = self._compile(template_id, language, template_file, styles_file)
+            self._entries[key] = entry
+
+        return entry
+
+    def preload(self, template_id: str, template_file: str, styles_file: str) -> list[CompiledTemplate]:
+        template_root = self._templates_dir / template_id
+        if not template_root.is_dir():
+            return []
+
+        compiled = []
+        for language_dir in sorted(p for p in template_root.iterdir() if p.is_dir()):
+            if (language_dir / template_file).exists():
+                compiled.append(
+                    self.get(template_id, language_dir.name, template_file, styles_file)
+                )
+        return compiled
+
+    def _compile(
+        self,
+        template_id: str,
+        language: str,
+        template_file: str,
+        styles_file: str,
+    ) -> CompiledTemplate:
+        base_dir = self._templates_dir / template_id / language
+        template_path = base_dir / template_file
+        stylesheet_path = base_dir / styles_file
+
+        template = self._env.get_template(f"{template_id}/{language}/{template_file}")
+
+        stylesheet_source = None
+        if stylesheet_path.exists():
+            stylesheet_source = stylesheet_path.read_text(encoding="utf-8")
+
+        return CompiledTemplate(
+            template=template,
+            base_dir=base_dir,
+            template_file=template_path,
+            stylesheet_file=stylesheet_path,
+            stylesheet_source=stylesheet_source,
+            fingerprint=self._fingerprint(template_path, stylesheet_path),
+        )
+
+    def _is_stale(self, entry: CompiledTemplate) -> bool:
+        return entry.fingerprint != self._fingerprint(entry.template_file, entry.stylesheet_file)
+
+    def _fingerprint(self, template_path: Path, stylesheet_path: Path) -> str:
+        return (
+            f"{template_path.name}:{_file_version(template_path)}"
+            f"|{stylesheet_path.name}:{_file_version(stylesheet_path)}"
+        )
@@ -0,0 +1,72 @@
+"""Read-only attribute views used as Jinja context for resume dicts."""
+
+from __future__ import annotations
+
+from typing import Any
+
+SKILL_CATEGORIES = ("languages", "frameworks", "tools")
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+class TemplateView:
+    """
+    Visão somente leitura de um dict com acesso por atributo.
+
+    A classe é única (não é recriada a cada chamada como a antiga DotDict),
+    então construir o contexto não deixa ciclos de referência para o coletor
+    de lixo. O tempo de construção e render fica no mesmo patamar da versão
+    anterior; o ganho é só esse. Chaves ausentes retornam None.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("TemplateView is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("TemplateView is read-only")
+
+
+def build_template_context(data: dict) -> TemplateView:
+    view = _new_object(TemplateView)
+    _set_attribute(
+        view,
+        "__dict__",
+        {
+            key: _wrap(key, value) if isinstance(value, (dict, list)) else value
+            for key, value in data.items()
+        },
+    )
+    return view
+
+
+def _wrap(key: str, value: dict | list) -> Any:
+    if isinstance(value, dict):
+        return build_template_context(value)
+    if key == "skills" and _is_categorized_skills(value):
+        return build_template_context(_merge_skill_categories(value))
+    return [build_template_context(item) if isinstance(item, dict) else item for item in value]
+
+
+def _is_categorized_skills(items: list) -> bool:
+    return bool(items) and isinstance(items[0], dict) and any(
+        category in items[0] for category in SKILL_CATEGORIES
+    )
+
+
+def _merge_skill_categories(items: list) -> dict[str, list]:
+    # [{"languages": [...]}, {"tools": [...]}] -> {"languages": [...], "tools": [...]}
+    merged: dict[str, list] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for category, values in item.items():
+            bucket = merged.setdefault(category, [])
+            if isinstance(values, list):
+                bucket.extend(values)
+    return merged
@@ -1,25 +1,44 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import re
+import unicodedata
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Sequence
+from uuid import uuid4
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import CSS, HTML
 
 from domain.ports.outbound.pdf_renderer_port import (
+    PDFRenderBusyError,
     PDFRendererPort,
     PDFRenderRequest,
     PDFRenderResult,
     TemplateInfo,
 )
+from infrastructure.adapters.outbound.pdf.render_cache import (
+    PDFRenderCache,
+    build_render_key,
+    canonicalize_resume,
+)
+from infrastructure.adapters.outbound.pdf.render_pool import TMP_SUFFIX, PDFRenderPool
+from infrastructure.adapters.outbound.pdf.template_cache import CompiledTemplate, TemplateCache
+from infrastructure.adapters.outbound.pdf.template_context import build_template_context
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent.parent / "templates"
 
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-z0-9_-]+")
+
+BATCH_BUSY_RETRY_SECONDS = 0.5
+BATCH_BUSY_MAX_RETRIES = 20
+
 
 @dataclass
 class TemplateConfig:
@@ -39,55 +58,251 @@ AVAILABLE_TEMPLATES: dict[str, TemplateConfig] = {
 }
 
 
+@dataclass(frozen=True)
+class _RenderPlan:
+    template_path: str
+    language: str
+    compiled: CompiledTemplate
+    render_key: str | None
+    filename: str
+    filepath: Path
+
+    @property
+    def stylesheet(self) -> tuple[str, str] | None:
+        if not self.compiled.stylesheet_path:
+            return None
+        return str(self.compiled.stylesheet_path), self.compiled.fingerprint
+
+    def to_result(self, cached: bool = False) -> PDFRenderResult:
+        return PDFRenderResult(
+            filename=self.filename,
+            filepath=str(self.filepath),
+            template_used=self.template_path,
+            cached=cached,
+        )
+
+
+@dataclass(frozen=True)
+class PreviewPlan:
+    resume: Any
+    plan: _RenderPlan
+
+    @property
+    def etag(self) -> str | None:
+        render_key = self.plan.render_key
+        return f'"{render_key[:32]}"' if render_key else None
+
+
+@dataclass(frozen=True)
+class RenderedPDF:
+    content: bytes
+    filename: str
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    filename: str
+    skipped: list[str]
+
+
 class WeasyPrintAdapter(PDFRendererPort):
     def __init__(
         self,
         templates_dir: Path | None = None,
         storage_dir: Path | None = None,
+        render_pool: PDFRenderPool | None = None,
+        render_cache: PDFRenderCache | None = None,
+        auto_reload: bool = False,
     ) -> None:
         self._templates_dir = templates_dir or DEFAULT_TEMPLATES_DIR
         self._storage_dir = storage_dir or Path("storage")
         self._storage_dir.mkdir(parents=True, exist_ok=True)
+        self._render_pool = render_pool or PDFRenderPool()
+        self._render_cache = render_cache or PDFRenderCache(self._storage_dir)
+        self._pending_renders: dict[str, asyncio.Future] = {}
 
         self._jinja_env = Environment(
             loader=FileSystemLoader(str(self._templates_dir)),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=auto_reload,
+        )
+        self._template_cache = TemplateCache(self._jinja_env, self._templates_dir, auto_reload)
+
+    async def warm_up(self) -> None:
+        compiled: list[CompiledTemplate] = []
+        for config in AVAILABLE_TEMPLATES.values():
+            compiled.extend(
+                self._template_cache.preload(config.id, config.template_file, config.styles_file)
+            )
+
+        self._render_pool.preload_stylesheets(
+            [(str(c.stylesheet_path), c.fingerprint) for c in compiled if c.stylesheet_path]
         )
+        await self._render_pool.start()
+        logger.info(f"PDF renderer warmed up with {len(compiled)} templates")
+
+    async def prepare(self, template_id: str = "default", language: str = "pt") -> None:
+        config = AVAILABLE_TEMPLATES.get(template_id) or AVAILABLE_TEMPLATES["default"]
+        await asyncio.to_thread(self._get_compiled_template, config.id, language, config)
+        if not self._render_pool.started:
+            await self._render_pool.start()
 
     async def render_pdf(self, request: PDFRenderRequest) -> PDFRenderResult:
-        template_id = request.template_id or "default"
-        language = request.language or "pt"
-        template_config = AVAILABLE_TEMPLATES.get(template_id)
+        plan = self._plan_render(request)
 
-        if not template_config:
-            template_id = "default"
-            template_config = AVAILABLE_TEMPLATES["default"]
+        if plan.render_key and await self._render_cache.lookup(plan.filename):
+            logger.info(f"PDF cache hit: {plan.filepath} (language: {plan.language})")
+            return plan.to_result(cached=True)
+
+        # Requests idênticos simultâneos compartilham a mesma renderização.
+        task = self._pending_renders.get(plan.filename)
+        if task is None:
+            html_content = self._render_html(request.resume, plan.compiled)
+            task = asyncio.ensure_future(
+                self._render_pool.write_pdf(
+                    html_content,
+                    str(plan.compiled.base_dir),
+                    plan.stylesheet,
+                    str(plan.filepath),
+                )
+            )
+            self._pending_renders[plan.filename] = task
+            task.add_done_callback(
+                lambda _: self._on_render_done(plan.filename, plan.render_key)
+            )
+
+        await asyncio.shield(task)
+
+        logger.info(f"PDF generated: {plan.filepath} (language: {plan.language})")
+        return plan.to_result()
 
-        template_path = f"{template_id}/{language}"
-        html_content = self._render_html(request.resume, template_path, template_config)
-        filename = self._build_filename(request.resume)
-        filepath = self._storage_dir / filename
+    async def render_pdf_bytes(self, request: PDFRenderRequest) -> bytes:
+        return (await self.render_pdf_content(request)).content
 
-        css_path = self._templates_dir / template_id / language / template_config.styles_file
-        css = CSS(filename=str(css_path)) if css_path.exists() else None
+    async def render_pdf_content(self, request: PDFRenderRequest) -> RenderedPDF:
+        plan = self._plan_render(request)
 
-        html_doc = HTML(
-            string=html_content,
-            base_url=str(self._templates_dir / template_id / language),
+        if plan.render_key:
+            pending = self._pending_renders.get(plan.filename)
+            if pending is not None:
+                await asyncio.shield(pending)
+            if await self._render_cache.lookup(plan.filename):
+                logger.info(f"PDF cache hit (bytes): {plan.filepath}")
+                content = await asyncio.to_thread(plan.filepath.read_bytes)
+                return RenderedPDF(content=content, filename=plan.filename)
+
+        # Sem hit: renderiza direto em memória, sem passar pelo storage.
+        html_content = self._render_html(request.resume, plan.compiled)
+        content = await self._render_pool.render_bytes(
+            html_content,
+            str(plan.compiled.base_dir),
+            plan.stylesheet,
         )
+        logger.info(f"PDF generated in memory: {len(content)} bytes (language: {plan.language})")
+        return RenderedPDF(content=content, filename=plan.filename)
 
-        if css:
-            html_doc.write_pdf(str(filepath), stylesheets=[css])
-        else:
-            html_doc.write_pdf(str(filepath))
+    def plan_preview(self, request: PDFRenderRequest) -> PreviewPlan:
+        """Planeja o preview uma vez; a ETag e o HTML saem do mesmo plano."""
+        return PreviewPlan(resume=request.resume, plan=self._plan_render(request))
 
-        logger.info(f"PDF generated: {filepath} (language: {language})")
+    def render_html(self, preview: PreviewPlan) -> str:
+        """HTML do currículo com o CSS embutido, pronto para exibir no navegador."""
+        plan = preview.plan
+        html_content = self._render_html(preview.resume, plan.compiled)
 
-        return PDFRenderResult(
-            filename=filename,
-            filepath=str(filepath),
-            template_used=f"{template_id}/{language}",
+        stylesheet = plan.compiled.stylesheet_source
+        if not stylesheet:
+            return html_content
+
+        link_pattern = re.compile(
+            rf'<link[^>]*href="{re.escape(plan.compiled.stylesheet_file.name)}"[^>]*>'
         )
+        html_content = link_pattern.sub("", html_content, count=1)
+        return html_content.replace("</head>", f"<style>\n{stylesheet}\n</style>\n</head>", 1)
+
+    async def render_many(
+        self, requests: Sequence[PDFRenderRequest]
+    ) -> AsyncIterator[tuple[int, PDFRenderResult | Exception]]:
+        """Renderiza em paralelo (um por worker) e entrega cada resultado ao terminar."""
+        semaphore = asyncio.Semaphore(self._render_pool.max_workers)
+
+        async def render(index: int, request: PDFRenderRequest):
+            async with semaphore:
+                for attempt in range(BATCH_BUSY_MAX_RETRIES + 1):
+                    try:
+                        return index, await self.render_pdf(request)
+                    except PDFRenderBusyError as e:
+                        # Lotes cedem espaço ao tráfego interativo em vez de falhar.
+                        if attempt == BATCH_BUSY_MAX_RETRIES:
+                            return index, e
+                        await asyncio.sleep(BATCH_BUSY_RETRY_SECONDS)
+                    except Exception as e:
+                        return index, e
+
+        tasks = [asyncio.ensure_future(render(i, r)) for i, r in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def create_archive(
+        self, items: Sequence[tuple[str, PDFRenderRequest]]
+    ) -> ArchiveResult:
+        """
+        Compacta os PDFs (nome do arquivo, request que o gerou) em um ZIP.
+
+        O LRU do cache e o sweeper podem remover um PDF entre a renderização
+        e o ZIP: arquivos ausentes são renderizados de novo, e os que ainda
+        assim faltarem ficam de fora e são listados em skipped.
+        """
+        filenames: list[str] = []
+        skipped: list[str] = []
+        for filename, request in items:
+            if (self._storage_dir / filename).exists():
+                filenames.append(filename)
+                continue
+            try:
+                result = await self.render_pdf(request)
+                filenames.append(result.filename)
+                logger.info(f"Re-rendered missing archive item {filename} as {result.filename}")
+            except Exception as e:
+                logger.warning(f"Skipping missing archive item {filename}: {e}")
+                skipped.append(filename)
+
+        archive_name = f"resumes_{uuid4().hex}.zip"
+        skipped.extend(await asyncio.to_thread(self._write_archive, archive_name, filenames))
+        logger.info(
+            f"Archive generated: {archive_name} "
+            f"({len(items) - len(skipped)} files, {len(skipped)} skipped)"
+        )
+        return ArchiveResult(filename=archive_name, skipped=skipped)
+
+    def _write_archive(self, archive_name: str, filenames: list[str]) -> list[str]:
+        target = self._storage_dir / archive_name
+        tmp_path = self._storage_dir / f".{archive_name}.{uuid4().hex}{TMP_SUFFIX}"
+        skipped: list[str] = []
+        try:
+            # PDFs já são comprimidos; ZIP_STORED evita gastar CPU à toa.
+            with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+                for index, filename in enumerate(filenames, start=1):
+                    try:
+                        archive.write(
+                            self._storage_dir / filename, arcname=f"{index:04d}_{filename}"
+                        )
+                    except FileNotFoundError:
+                        skipped.append(filename)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return skipped
+
+    def _on_render_done(self, filename: str, render_key: str | None) -> None:
+        task = self._pending_renders.pop(filename, None)
+        if render_key and task is not None and not task.cancelled() and task.exception() is None:
+            self._render_cache.add(filename)
 
     def get_available_templates(self) -> list[TemplateInfo]:
         return [
@@ -95,47 +310,58 @@ class WeasyPrintAdapter(PDFRendererPort):
             for c in AVAILABLE_TEMPLATES.values()
         ]
 
-    def _render_html(self, resume: Any, template_path: str, config: TemplateConfig) -> str:
-        template = self._jinja_env.get_template(f"{template_path}/{config.template_file}")
+    def _plan_render(self, request: PDFRenderRequest) -> _RenderPlan:
+        template_id = request.template_id or "default"
+        language = request.language or "pt"
+        template_config = AVAILABLE_TEMPLATES.get(template_id)
+
+        if not template_config:
+            template_id = "default"
+            template_config = AVAILABLE_TEMPLATES["default"]
+
+        compiled = self._get_compiled_template(template_id, language, template_config)
+        render_key = self._build_render_key(request.resume, template_id, language, compiled)
+        artifact_id = render_key[:16] if render_key else uuid4().hex
+        filename = self._build_filename(request.resume, artifact_id)
+
+        return _RenderPlan(
+            template_path=f"{template_id}/{language}",
+            language=language,
+            compiled=compiled,
+            render_key=render_key,
+            filename=filename,
+            filepath=self._storage_dir / filename,
+        )
+
+    def _get_compiled_template(
+        self, template_id: str, language: str, config: TemplateConfig
+    ) -> CompiledTemplate:
+        return self._template_cache.get(
+            template_id, language, config.template_file, config.styles_file
+        )
+
+    def _render_html(self, resume: Any, compiled: CompiledTemplate) -> str:
         context = self._prepare_template_context(resume)
-        return template.render(**context)
+        return compiled.template.render(**context)
 
     def _prepare_template_context(self, resume: Any) -> dict[str, Any]:
         if isinstance(resume, dict):
-            return {"resume": self._dict_to_template_context(resume)}
+            return {"resume": build_template_context(resume)}
         return {"resume": resume}
 
-    def _dict_to_template_context(self, data: dict) -> Any:
-        class DotDict:
-            def __init__(self, d: dict):
-                for k, v in d.items():
-                    if isinstance(v, dict):
-                        setattr(self, k, DotDict(v))
-                    elif isinstance(v, list):
-                        if k == "skills" and v and isinstance(v[0], dict):
-                            if any(key in v[0] for key in ["languages", "frameworks", "tools"]):
-                                skills_dict = {}
-                                for item in v:
-                                    if isinstance(item, dict):
-                                        for cat, values in item.items():
-                                            if cat not in skills_dict:
-                                                skills_dict[cat] = []
-                                            if isinstance(values, list):
-                                                skills_dict[cat].extend(values)
-                                setattr(self, k, DotDict(skills_dict))
-                            else:
-                                setattr(self, k, [DotDict(i) if isinstance(i, dict) else i for i in v])
-                        else:
-                            setattr(self, k, [DotDict(i) if isinstance(i, dict) else i for i in v])
-                    else:
-                        setattr(self, k, v)
-
-            def __getattr__(self, name: str) -> Any:
-                return None
-
-        return DotDict(data)
-
-    def _build_filename(self, resume: Any) -> str:
+    def _build_render_key(
+        self,
+        resume: Any,
+        template_id: str,
+        language: str,
+        compiled: CompiledTemplate,
+    ) -> str | None:
+        data = canonicalize_resume(resume)
+        if data is None:
+            return None
+        return build_render_key(data, template_id, language, compiled.fingerprint)
+
+    def _build_filename(self, resume: Any, artifact_id: str) -> str:
         candidate_name = None
         if isinstance(resume, dict):
             candidate_name = resume.get("candidate_name") or resume.get("name")
@@ -143,6 +369,10 @@ class WeasyPrintAdapter(PDFRendererPort):
             candidate_name = resume.candidate_name
 
         if candidate_name:
-            safe_name = "_".join(candidate_name.lower().split())
-            return f"resume_{safe_name}.pdf"
-        return "resume.pdf"
+            ascii_name = (
+                unicodedata.normalize("NFKD", candidate_name).encode("ascii", "ignore").decode()
+            )
+            safe_name = _UNSAFE_FILENAME_CHARS.sub("", "_".join(ascii_name.lower().split()))[:60]
+            if safe_name:
+                return f"resume_{safe_name}_{artifact_id}.pdf"
+        return f"resume_{artifact_id}.pdf"
@@ -1,6 +1,7 @@
 """Vector Store adapters."""
 
+from .local_adapter import LocalVectorStoreAdapter
+from .mirrored_adapter import MirroredVectorStore
 from .qdrant_adapter import QdrantAdapter
 
-__all__ = ["QdrantAdapter"]
-
+__all__ = ["LocalVectorStoreAdapter", "MirroredVectorStore", "QdrantAdapter"]
@@ -0,0 +1,489 @@
+"""In-process vector store on a float32 NumPy matrix with on-disk snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Optional
+from uuid import uuid4
+
+import numpy as np
+
+from domain.ports.outbound.vector_store_port import (
+    VectorDocument,
+    VectorSearchResult,
+    VectorStorePort,
+    matches_filter,
+)
+
+logger = logging.getLogger(__name__)
+
+_SAFE_COLLECTION_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+_MIN_CAPACITY = 1024
+
+
+class _LocalCollection:
+    """
+    Vetores normalizados em uma matriz float32 (similaridade de cosseno vira
+    produto interno) e payloads na mesma ordem das linhas. Remoções trocam a
+    linha removida pela última, mantendo a matriz compacta.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+        self.vectors: np.ndarray = np.empty((0, dimension), dtype=np.float32)
+        self.ids: list[str] = []
+        self.payloads: list[dict] = []
+        self.rows: dict[str, int] = {}
+        self.dirty = False
+
+    @property
+    def count(self) -> int:
+        return len(self.ids)
+
+    def upsert(self, documents: list[VectorDocument]) -> None:
+        matrix = _normalize(np.asarray([d.embedding for d in documents], dtype=np.float32))
+        if matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected embeddings of dimension {self.dimension}, got {matrix.shape[1]}"
+            )
+
+        new_rows = sum(1 for d in documents if d.id not in self.rows)
+        self._reserve(self.count + new_rows)
+
+        for document, vector in zip(documents, matrix):
+            payload = {"content": document.content, **document.metadata}
+            row = self.rows.get(document.id)
+            if row is None:
+                row = self.count
+                self.rows[document.id] = row
+                self.ids.append(document.id)
+                self.payloads.append(payload)
+            else:
+                self.payloads[row] = payload
+            self.vectors[row] = vector
+
+        self.dirty = True
+
+    def delete(self, document_ids: Iterable[str]) -> int:
+        self._reserve(self.count)
+        deleted = 0
+        for document_id in document_ids:
+            row = self.rows.pop(document_id, None)
+            if row is None:
+                continue
+
+            last = self.count - 1
+            if row != last:
+                moved_id = self.ids[last]
+                self.ids[row] = moved_id
+                self.payloads[row] = self.payloads[last]
+                self.vectors[row] = self.vectors[last]
+                self.rows[moved_id] = row
+            self.ids.pop()
+            self.payloads.pop()
+            deleted += 1
+
+        if deleted:
+            self.dirty = True
+        return deleted
+
+    def search(
+        self,
+        query_vector: list[float],
+        limit: int,
+        filter_metadata: Optional[dict],
+        score_threshold: Optional[float],
+    ) -> list[tuple[int, float]]:
+        if self.count == 0:
+            return []
+
+        query = _normalize(np.asarray(query_vector, dtype=np.float32)[None, :])[0]
+        scores = self.vectors[: self.count] @ query
+
+        if filter_metadata:
+            mask = np.fromiter(
+                (matches_filter(payload, filter_metadata) for payload in self.payloads),
+                dtype=bool,
+                count=self.count,
+            )
+            scores = np.where(mask, scores, -np.inf)
+
+        if limit < self.count:
+            candidates = np.argpartition(-scores, limit)[:limit]
+        else:
+            candidates = np.arange(self.count)
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        # Linhas fora do filtro têm score -inf e nunca são retornadas.
+        minimum = np.finfo(np.float32).min if score_threshold is None else score_threshold
+        return [(int(row), float(scores[row])) for row in candidates if scores[row] >= minimum]
+
+    def _reserve(self, size: int) -> None:
+        # Snapshots carregados são memmap somente leitura; a primeira escrita
+        # copia para memória com folga para crescer.
+        if size <= self.vectors.shape[0] and self.vectors.flags.writeable:
+            return
+
+        capacity = max(size, _MIN_CAPACITY, self.vectors.shape[0] * 2)
+        grown = np.empty((capacity, self.dimension), dtype=np.float32)
+        grown[: self.count] = self.vectors[: self.count]
+        self.vectors = grown
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class LocalVectorStoreAdapter(VectorStorePort):
+    """
+    Vector store em processo para desenvolvimento, CI e deploys de um nó só.
+
+    Cada collection vive em uma matriz float32 com busca top-k vetorizada.
+    Snapshots ficam em base_dir/<collection>/: os vetores em um arquivo cru
+    carregado via memmap (sem ler tudo para a memória) e os payloads em JSON.
+    Sem base_dir o store é só em memória.
+
+    Escritas agendam um snapshot em até flush_interval_seconds (no máximo
+    um por intervalo, gravado em thread), então uma queda perde no máximo
+    esse intervalo de escritas. close() grava o que faltar.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Path],
+        collection_name: str,
+        embedding_dimension: int = 1536,
+        flush_interval_seconds: float = 5.0,
+    ) -> None:
+        self._base_dir = base_dir
+        self._collection_name = collection_name
+        self._dimension = embedding_dimension
+        self._flush_interval = flush_interval_seconds
+        self._collections: dict[str, _LocalCollection] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_writing = False
+
+    async def add_documents(
+        self,
+        documents: list[VectorDocument],
+        collection_name: str | None = None,
+    ) -> list[str]:
+        if not documents:
+            return []
+
+        for doc in documents:
+            if not doc.embedding:
+                raise ValueError(f"Document {doc.id} missing embedding")
+
+        collection = self._get_or_create(collection_name or self._collection_name)
+        collection.upsert(documents)
+        self._schedule_flush()
+        logger.info(f"Added {len(documents)} documents to local collection")
+        return [doc.id for doc in documents]
+
+    async def search(
+        self,
+        query: str,
+        collection_name: str | None = None,
+        limit: int = 10,
+        filter_metadata: Optional[dict] = None,
+        query_vector: Optional[list[float]] = None,
+        score_threshold: Optional[float] = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+    ) -> list[VectorSearchResult]:
+        if not query_vector:
+            raise ValueError(
+                "query_vector is required. Use EmbeddingService to generate embeddings."
+            )
+
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return []
+
+        return [
+            VectorSearchResult(
+                document=self._document(collection, row, payload_fields, include_content),
+                score=score,
+                distance=1.0 - score,
+            )
+            for row, score in collection.search(
+                query_vector, limit, filter_metadata, score_threshold
+            )
+        ]
+
+    async def get_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+        include_vectors: bool = False,
+    ) -> list[VectorDocument]:
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return []
+
+        documents = []
+        for document_id in document_ids:
+            row = collection.rows.get(document_id)
+            if row is None:
+                continue
+            document = self._document(collection, row, payload_fields, include_content)
+            if include_vectors:
+                document.embedding = collection.vectors[row].tolist()
+            documents.append(document)
+        return documents
+
+    def _document(
+        self,
+        collection: _LocalCollection,
+        row: int,
+        payload_fields: Optional[list[str]],
+        include_content: bool,
+    ) -> VectorDocument:
+        payload = collection.payloads[row]
+        if payload_fields is not None:
+            metadata = {k: payload[k] for k in payload_fields if k in payload and k != "content"}
+        else:
+            metadata = {k: v for k, v in payload.items() if k != "content"}
+        return VectorDocument(
+            id=collection.ids[row],
+            content=payload.get("content", "") if include_content else "",
+            metadata=metadata,
+        )
+
+    async def existing_ids(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> set[str]:
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return set()
+        return {document_id for document_id in document_ids if document_id in collection.rows}
+
+    async def payload_values(
+        self,
+        document_ids: list[str],
+        field: str,
+        collection_name: str | None = None,
+    ) -> dict[str, Any]:
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return {}
+        return {
+            document_id: collection.payloads[collection.rows[document_id]].get(field)
+            for document_id in document_ids
+            if document_id in collection.rows
+        }
+
+    async def scroll_documents(
+        self,
+        collection_name: str | None = None,
+        batch_size: int = 256,
+        include_vectors: bool = True,
+    ) -> AsyncIterator[list[VectorDocument]]:
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return
+
+        for start in range(0, collection.count, batch_size):
+            rows = range(start, min(start + batch_size, collection.count))
+            yield [
+                VectorDocument(
+                    id=collection.ids[row],
+                    content=collection.payloads[row].get("content", ""),
+                    metadata={k: v for k, v in collection.payloads[row].items() if k != "content"},
+                    embedding=collection.vectors[row].tolist() if include_vectors else None,
+                )
+                for row in rows
+            ]
+
+    async def delete_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> int:
+        collection = self._get(collection_name or self._collection_name)
+        if collection is None:
+            return 0
+        deleted = collection.delete(document_ids)
+        if deleted:
+            self._schedule_flush()
+        return deleted
+
+    async def create_collection(
+        self,
+        collection_name: str,
+        dimension: int = 1536,
+    ) -> bool:
+        _validate_collection_name(collection_name)
+        self._collections.setdefault(collection_name, _LocalCollection(dimension))
+        logger.info(f"Created local collection: {collection_name}")
+        return True
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return self._get(collection_name) is not None
+
+    async def is_healthy(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        task = self._flush_task
+        if task is not None:
+            # Interrompe só a espera; uma gravação em andamento termina antes.
+            if not self._flush_writing:
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+        self.snapshot()
+
+    def snapshot(self, collection_name: str | None = None) -> None:
+        for name, captured in self._capture(collection_name):
+            self._write_snapshot(name, *captured)
+
+    def _schedule_flush(self) -> None:
+        if self._base_dir is None or self._flush_task is not None:
+            return
+        self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+
+        # A cópia é feita no event loop (escritas concorrentes não a veem pela
+        # metade); só a gravação em disco vai para a thread.
+        self._flush_writing = True
+        try:
+            for name, captured in self._capture():
+                try:
+                    await asyncio.to_thread(self._write_snapshot, name, *captured)
+                except Exception as e:
+                    logger.error(f"Local vector snapshot failed for {name}: {e}")
+                    self._collections[name].dirty = True
+        finally:
+            self._flush_writing = False
+            self._flush_task = None
+
+        # Escritas feitas durante a gravação (ou uma gravação que falhou).
+        if any(collection.dirty for collection in self._collections.values()):
+            self._schedule_flush()
+
+    def _capture(
+        self, collection_name: str | None = None
+    ) -> list[tuple[str, tuple[int, np.ndarray, list[str], list[dict]]]]:
+        if self._base_dir is None:
+            return []
+
+        names = [collection_name] if collection_name else list(self._collections)
+        captured = []
+        for name in names:
+            collection = self._collections.get(name)
+            if collection is None or not collection.dirty:
+                continue
+            captured.append(
+                (
+                    name,
+                    (
+                        collection.dimension,
+                        collection.vectors[: collection.count].copy(),
+                        list(collection.ids),
+                        list(collection.payloads),
+                    ),
+                )
+            )
+            collection.dirty = False
+        return captured
+
+    def _get(self, name: str) -> Optional[_LocalCollection]:
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self._load_snapshot(name)
+            if collection is not None:
+                self._collections[name] = collection
+        return collection
+
+    def _get_or_create(self, name: str) -> _LocalCollection:
+        collection = self._get(name)
+        if collection is None:
+            _validate_collection_name(name)
+            collection = _LocalCollection(self._dimension)
+            self._collections[name] = collection
+        return collection
+
+    def _write_snapshot(
+        self,
+        name: str,
+        dimension: int,
+        vectors: np.ndarray,
+        ids: list[str],
+        payloads: list[dict],
+    ) -> None:
+        directory = self._base_dir / name
+        directory.mkdir(parents=True, exist_ok=True)
+        version = uuid4().hex
+        vectors_file = f"vectors-{version}.f32"
+        payloads_file = f"payloads-{version}.json"
+
+        vectors.tofile(directory / vectors_file)
+        (directory / payloads_file).write_text(
+            json.dumps({"ids": ids, "payloads": payloads}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+        # O manifest é trocado por último: um snapshot incompleto nunca é lido.
+        manifest = {
+            "dimension": dimension,
+            "count": len(ids),
+            "vectors": vectors_file,
+            "payloads": payloads_file,
+        }
+        tmp_manifest = directory / f".manifest.{version}.tmp"
+        tmp_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_manifest, directory / "manifest.json")
+
+        for path in directory.iterdir():
+            if path.name not in (vectors_file, payloads_file, "manifest.json"):
+                path.unlink(missing_ok=True)
+
+        logger.info(f"Local vector snapshot written: {name} ({len(ids)} vectors)")
+
+    def _load_snapshot(self, name: str) -> Optional[_LocalCollection]:
+        if self._base_dir is None or not _SAFE_COLLECTION_NAME.match(name):
+            return None
+
+        directory = self._base_dir / name
+        try:
+            manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+        collection = _LocalCollection(manifest["dimension"])
+        stored = json.loads((directory / manifest["payloads"]).read_text(encoding="utf-8"))
+        collection.ids = stored["ids"]
+        collection.payloads = stored["payloads"]
+        collection.rows = {document_id: row for row, document_id in enumerate(collection.ids)}
+
+        if manifest["count"]:
+            collection.vectors = np.memmap(
+                directory / manifest["vectors"],
+                dtype=np.float32,
+                mode="r",
+                shape=(manifest["count"], manifest["dimension"]),
+            )
+
+        logger.info(f"Local vector snapshot loaded: {name} ({collection.count} vectors)")
+        return collection
+
+
+def _validate_collection_name(name: str) -> None:
+    if not _SAFE_COLLECTION_NAME.match(name):
+        raise ValueError(f"Invalid collection name: {name}")
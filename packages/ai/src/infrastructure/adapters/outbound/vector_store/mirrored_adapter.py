@@ -0,0 +1,244 @@
+"""Qdrant-backed vector store that serves small hot collections from memory."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Optional
+
+from domain.ports.outbound.vector_store_port import (
+    VectorDocument,
+    VectorSearchResult,
+    VectorStorePort,
+)
+from infrastructure.adapters.outbound.vector_store.local_adapter import LocalVectorStoreAdapter
+from infrastructure.adapters.outbound.vector_store.qdrant_adapter import QdrantAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class MirroredVectorStore(VectorStorePort):
+    """
+    Qdrant continua sendo a fonte da verdade; as collections "quentes" são
+    copiadas para um LocalVectorStoreAdapter em memória na primeira busca e
+    passam a ser respondidas localmente. Escritas vão para os dois lados.
+
+    A cópia é recarregada em background a cada refresh_seconds para trazer
+    escritas feitas por outros pods. Escritas locais feitas enquanto a nova
+    cópia é montada ficam num log e são reaplicadas nela antes da troca.
+    Uma carga que falha só é tentada de novo depois de refresh_seconds.
+    Collections maiores que max_vectors não são espelhadas.
+    """
+
+    def __init__(
+        self,
+        primary: QdrantAdapter,
+        hot_collections: set[str],
+        default_collection: str,
+        embedding_dimension: int = 1536,
+        max_vectors: int = 50_000,
+        refresh_seconds: float = 300.0,
+    ) -> None:
+        self._primary = primary
+        self._hot_collections = hot_collections
+        self._default_collection = default_collection
+        self._dimension = embedding_dimension
+        self._max_vectors = max_vectors
+        self._refresh_seconds = refresh_seconds
+        self._mirrors: dict[str, tuple[float, LocalVectorStoreAdapter]] = {}
+        self._skipped: set[str] = set()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        # Escritas feitas durante uma carga, na ordem em que aconteceram.
+        self._write_logs: dict[str, list[tuple[str, Any]]] = {}
+        self._failed_at: dict[str, float] = {}
+
+    async def add_documents(
+        self,
+        documents: list[VectorDocument],
+        collection_name: str | None = None,
+    ) -> list[str]:
+        ids = await self._primary.add_documents(documents, collection_name)
+        self._log_write(collection_name, "add", documents)
+        mirror = self._mirror(collection_name)
+        if mirror is not None:
+            await mirror.add_documents(documents, self._name(collection_name))
+        return ids
+
+    async def search(
+        self,
+        query: str,
+        collection_name: str | None = None,
+        limit: int = 10,
+        filter_metadata: Optional[dict] = None,
+        query_vector: Optional[list[float]] = None,
+        score_threshold: Optional[float] = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+    ) -> list[VectorSearchResult]:
+        store: VectorStorePort = await self._store_for(collection_name)
+        return await store.search(
+            query=query,
+            collection_name=self._name(collection_name),
+            limit=limit,
+            filter_metadata=filter_metadata,
+            query_vector=query_vector,
+            score_threshold=score_threshold,
+            payload_fields=payload_fields,
+            include_content=include_content,
+        )
+
+    async def existing_ids(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> set[str]:
+        store = await self._store_for(collection_name)
+        return await store.existing_ids(document_ids, self._name(collection_name))
+
+    async def get_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+        include_vectors: bool = False,
+    ) -> list[VectorDocument]:
+        store = await self._store_for(collection_name)
+        return await store.get_documents(
+            document_ids,
+            self._name(collection_name),
+            payload_fields=payload_fields,
+            include_content=include_content,
+            include_vectors=include_vectors,
+        )
+
+    async def payload_values(
+        self,
+        document_ids: list[str],
+        field: str,
+        collection_name: str | None = None,
+    ) -> dict[str, Any]:
+        store = await self._store_for(collection_name)
+        return await store.payload_values(document_ids, field, self._name(collection_name))
+
+    def scroll_documents(
+        self,
+        collection_name: str | None = None,
+        batch_size: int = 256,
+        include_vectors: bool = True,
+    ) -> AsyncIterator[list[VectorDocument]]:
+        return self._primary.scroll_documents(collection_name, batch_size, include_vectors)
+
+    async def delete_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> int:
+        deleted = await self._primary.delete_documents(document_ids, collection_name)
+        self._log_write(collection_name, "delete", document_ids)
+        mirror = self._mirror(collection_name)
+        if mirror is not None:
+            await mirror.delete_documents(document_ids, self._name(collection_name))
+        return deleted
+
+    async def create_collection(self, collection_name: str, dimension: int = 1536) -> bool:
+        return await self._primary.create_collection(collection_name, dimension)
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return await self._primary.collection_exists(collection_name)
+
+    async def is_healthy(self) -> bool:
+        return await self._primary.is_healthy()
+
+    async def close(self) -> None:
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        await self._primary.close()
+
+    def _name(self, collection_name: str | None) -> str:
+        return collection_name or self._default_collection
+
+    def _log_write(self, collection_name: str | None, operation: str, payload: Any) -> None:
+        log = self._write_logs.get(self._name(collection_name))
+        if log is not None:
+            log.append((operation, payload))
+
+    def _mirror(self, collection_name: str | None) -> Optional[LocalVectorStoreAdapter]:
+        entry = self._mirrors.get(self._name(collection_name))
+        return entry[1] if entry else None
+
+    async def _store_for(self, collection_name: str | None) -> VectorStorePort:
+        name = self._name(collection_name)
+        if name not in self._hot_collections or name in self._skipped:
+            return self._primary
+
+        entry = self._mirrors.get(name)
+        if entry is None:
+            if self._recently_failed(name):
+                return self._primary
+            lock = self._locks.setdefault(name, asyncio.Lock())
+            async with lock:
+                if (
+                    name not in self._mirrors
+                    and name not in self._skipped
+                    and not self._recently_failed(name)
+                ):
+                    await self._load(name)
+            entry = self._mirrors.get(name)
+            if entry is None:
+                return self._primary
+        elif time.monotonic() - entry[0] > self._refresh_seconds:
+            self._schedule_refresh(name)
+
+        return entry[1]
+
+    def _recently_failed(self, name: str) -> bool:
+        failed_at = self._failed_at.get(name)
+        return failed_at is not None and time.monotonic() - failed_at < self._refresh_seconds
+
+    def _schedule_refresh(self, name: str) -> None:
+        task = self._refresh_tasks.get(name)
+        if task is None or task.done():
+            self._refresh_tasks[name] = asyncio.create_task(self._load(name))
+
+    async def _load(self, name: str) -> None:
+        try:
+            total = await self._primary.count_documents(name)
+            if total > self._max_vectors:
+                logger.warning(
+                    f"Collection {name} has {total} vectors, above the mirror limit "
+                    f"({self._max_vectors}); serving it from Qdrant"
+                )
+                self._skipped.add(name)
+                self._mirrors.pop(name, None)
+                return
+
+            log = self._write_logs[name] = []
+            mirror = LocalVectorStoreAdapter(None, name, self._dimension)
+            async for page in self._primary.scroll_documents(name):
+                await mirror.add_documents(page, name)
+
+            # Reaplica, em ordem, o que foi escrito durante o scroll: a página
+            # lida pode ser anterior a um add ou delete feito nesse meio tempo.
+            while log:
+                operation, payload = log.pop(0)
+                if operation == "add":
+                    await mirror.add_documents(payload, name)
+                else:
+                    await mirror.delete_documents(payload, name)
+
+            # Troca a cópia inteira de uma vez; buscas em andamento usam a anterior.
+            self._mirrors[name] = (time.monotonic(), mirror)
+            self._failed_at.pop(name, None)
+            logger.info(f"Mirrored collection {name} in memory ({total} vectors)")
+        except Exception as e:
+            logger.error(f"Failed to mirror collection {name}: {e}")
+            # Adia a próxima tentativa; a cópia anterior, se houver, segue servindo.
+            self._failed_at[name] = time.monotonic()
+            entry = self._mirrors.get(name)
+            if entry is not None:
+                self._mirrors[name] = (time.monotonic(), entry[1])
+        finally:
+            self._write_logs.pop(name, None)
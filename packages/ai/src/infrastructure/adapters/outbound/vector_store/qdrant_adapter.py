@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
-from qdrant_client import QdrantClient
+import grpc
+import httpx
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 from qdrant_client.models import (
     Distance,
     VectorParams,
@@ -11,6 +15,7 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    PayloadSelectorExclude,
 )
 
 from domain.ports.outbound.vector_store_port import (
@@ -22,26 +27,90 @@ from infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_RETRYABLE_GRPC_CODES = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
+def create_qdrant_client() -> AsyncQdrantClient:
+    settings = get_settings()
+    return AsyncQdrantClient(
+        url=settings.qdrant_url,
+        api_key=settings.qdrant_api_key,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        grpc_port=settings.qdrant_grpc_port,
+        timeout=settings.qdrant_timeout_seconds,
+        # Sem limits explícitos o client desativa keep-alive para localhost.
+        limits=httpx.Limits(
+            max_connections=settings.qdrant_max_connections,
+            max_keepalive_connections=settings.qdrant_max_connections,
+        ),
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, ResponseHandlingException):
+        return True
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code is not None and error.status_code >= 500
+    if isinstance(error, grpc.aio.AioRpcError):
+        return error.code() in _RETRYABLE_GRPC_CODES
+    return False
+
 
 class QdrantAdapter(VectorStorePort):
-    def __init__(self, embedding_dimension: int = 1536):
+    def __init__(
+        self,
+        embedding_dimension: int = 1536,
+        client: AsyncQdrantClient | None = None,
+        max_retries: int | None = None,
+        retry_backoff_seconds: float | None = None,
+    ):
         settings = get_settings()
-        self._client = QdrantClient(
-            url=settings.qdrant_url,
-            api_key=settings.qdrant_api_key,
-        )
+        self._client = client or create_qdrant_client()
         self._collection_name = settings.qdrant_collection_name
         self._dimension = embedding_dimension
+        self._max_retries = (
+            settings.qdrant_max_retries if max_retries is None else max_retries
+        )
+        self._retry_backoff = (
+            settings.qdrant_retry_backoff_seconds
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
         self._initialized = False
+        self._init_lock = asyncio.Lock()
 
     async def _ensure_collection(self) -> None:
         if self._initialized:
             return
 
-        if not await self.collection_exists(self._collection_name):
-            await self.create_collection(self._collection_name, self._dimension)
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            if not await self.collection_exists(self._collection_name):
+                await self.create_collection(self._collection_name, self._dimension)
+
+            self._initialized = True
+
+    async def _call(self, operation: Callable[..., Awaitable[T]], **kwargs: Any) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await operation(**kwargs)
+            except Exception as e:
+                if attempt >= self._max_retries or not _is_retryable(e):
+                    raise
+                delay = self._retry_backoff * (2**attempt)
+                attempt += 1
+                logger.warning(
+                    f"Qdrant {operation.__name__} failed ({e}), retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
 
-        self._initialized = True
+    async def close(self) -> None:
+        await self._client.close()
 
     async def add_documents(
         self,
@@ -71,7 +140,8 @@ class QdrantAdapter(VectorStorePort):
             )
 
         try:
-            self._client.upsert(
+            await self._call(
+                self._client.upsert,
                 collection_name=collection,
                 points=points,
             )
@@ -88,6 +158,9 @@ class QdrantAdapter(VectorStorePort):
         limit: int = 10,
         filter_metadata: Optional[dict] = None,
         query_vector: Optional[list[float]] = None,
+        score_threshold: Optional[float] = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
     ) -> list[VectorSearchResult]:
         collection = collection_name or self._collection_name
 
@@ -106,24 +179,27 @@ class QdrantAdapter(VectorStorePort):
             if conditions:
                 query_filter = Filter(must=conditions)
 
+        with_payload = _payload_selector(payload_fields, include_content)
+
         try:
-            results = self._client.search(
+            results = await self._call(
+                self._client.search,
                 collection_name=collection,
                 query_vector=query_vector,
                 limit=limit,
                 query_filter=query_filter,
+                score_threshold=score_threshold,
+                with_payload=with_payload,
             )
 
             search_results = []
             for result in results:
+                # O payload é um dict novo por resultado; pode ser reaproveitado.
+                payload = result.payload or {}
                 doc = VectorDocument(
                     id=str(result.id),
-                    content=result.payload.get("content", ""),
-                    metadata={
-                        k: v
-                        for k, v in result.payload.items()
-                        if k != "content"
-                    },
+                    content=payload.pop("content", ""),
+                    metadata=payload,
                     embedding=None,
                 )
 
@@ -140,6 +216,133 @@ class QdrantAdapter(VectorStorePort):
             logger.error(f"Error searching: {e}")
             raise
 
+    async def existing_ids(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+    ) -> set[str]:
+        collection = collection_name or self._collection_name
+        await self._ensure_collection()
+
+        if not document_ids:
+            return set()
+
+        try:
+            points = await self._call(
+                self._client.retrieve,
+                collection_name=collection,
+                ids=document_ids,
+                with_payload=False,
+                with_vectors=False,
+            )
+            return {str(point.id) for point in points}
+        except UnexpectedResponse as e:
+            # Collection ainda não criada: nada existe.
+            if e.status_code == 404:
+                return set()
+            logger.error(f"Error checking existing documents: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error checking existing documents: {e}")
+            raise
+
+    async def payload_values(
+        self,
+        document_ids: list[str],
+        field: str,
+        collection_name: str | None = None,
+    ) -> dict[str, Any]:
+        collection = collection_name or self._collection_name
+        await self._ensure_collection()
+
+        if not document_ids:
+            return {}
+
+        try:
+            points = await self._call(
+                self._client.retrieve,
+                collection_name=collection,
+                ids=document_ids,
+                with_payload=[field],
+                with_vectors=False,
+            )
+            return {str(point.id): (point.payload or {}).get(field) for point in points}
+        except UnexpectedResponse as e:
+            if e.status_code == 404:
+                return {}
+            logger.error(f"Error reading document payloads: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error reading document payloads: {e}")
+            raise
+
+    async def get_documents(
+        self,
+        document_ids: list[str],
+        collection_name: str | None = None,
+        payload_fields: Optional[list[str]] = None,
+        include_content: bool = True,
+        include_vectors: bool = False,
+    ) -> list[VectorDocument]:
+        collection = collection_name or self._collection_name
+        if not document_ids:
+            return []
+
+        try:
+            points = await self._call(
+                self._client.retrieve,
+                collection_name=collection,
+                ids=document_ids,
+                with_payload=_payload_selector(payload_fields, include_content),
+                with_vectors=include_vectors,
+            )
+            return [self._to_document(point) for point in points]
+        except UnexpectedResponse as e:
+            if e.status_code == 404:
+                return []
+            logger.error(f"Error retrieving documents: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving documents: {e}")
+            raise
+
+    async def count_documents(self, collection_name: str | None = None) -> int:
+        collection = collection_name or self._collection_name
+        result = await self._call(self._client.count, collection_name=collection, exact=True)
+        return result.count
+
+    async def scroll_documents(
+        self,
+        collection_name: str | None = None,
+        batch_size: int = 256,
+        include_vectors: bool = True,
+    ) -> AsyncIterator[list[VectorDocument]]:
+        """Percorre a collection inteira em páginas."""
+        collection = collection_name or self._collection_name
+        offset = None
+        while True:
+            points, offset = await self._call(
+                self._client.scroll,
+                collection_name=collection,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=include_vectors,
+            )
+            if points:
+                yield [self._to_document(point) for point in points]
+            if offset is None:
+                return
+
+    def _to_document(self, point: Any) -> VectorDocument:
+        payload = point.payload or {}
+        return VectorDocument(
+            id=str(point.id),
+            content=payload.pop("content", ""),
+            metadata=payload,
+            embedding=point.vector,
+        )
+
     async def delete_documents(
         self,
         document_ids: list[str],
@@ -148,7 +351,8 @@ class QdrantAdapter(VectorStorePort):
         collection = collection_name or self._collection_name
 
         try:
-            self._client.delete(
+            await self._call(
+                self._client.delete,
                 collection_name=collection,
                 points_selector=document_ids,
             )
@@ -164,7 +368,7 @@ class QdrantAdapter(VectorStorePort):
         dimension: int = 1536,
     ) -> bool:
         try:
-            self._client.create_collection(
+            await self._client.create_collection(
                 collection_name=collection_name,
                 vectors_config=VectorParams(
                     size=dimension,
@@ -179,7 +383,7 @@ class QdrantAdapter(VectorStorePort):
 
     async def collection_exists(self, collection_name: str) -> bool:
         try:
-            collections = self._client.get_collections()
+            collections = await self._call(self._client.get_collections)
             return any(
                 col.name == collection_name for col in collections.collections
             )
@@ -189,8 +393,16 @@ class QdrantAdapter(VectorStorePort):
 
     async def is_healthy(self) -> bool:
         try:
-            self._client.get_collections()
+            await self._client.get_collections()
             return True
         except Exception:
             return False
 
+
+def _payload_selector(payload_fields: Optional[list[str]], include_content: bool) -> Any:
+    # Só trafega do Qdrant o payload que o chamador vai usar.
+    if payload_fields is not None:
+        return [*payload_fields, "content"] if include_content else list(payload_fields)
+    if not include_content:
+        return PayloadSelectorExclude(exclude=["content"])
+    return True
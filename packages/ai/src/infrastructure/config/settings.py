@@ -1,7 +1,7 @@
 """Application Settings - Environment configuration."""
 
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -38,11 +38,49 @@ class Settings(BaseSettings):
     # Anthropic
     anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
     
+    # Embeddings
+    embedding_max_batch_size: int = Field(default=100, alias="EMBEDDING_MAX_BATCH_SIZE")
+    embedding_max_concurrency: int = Field(default=4, alias="EMBEDDING_MAX_CONCURRENCY")
+    embedding_batch_window_ms: float = Field(default=5.0, alias="EMBEDDING_BATCH_WINDOW_MS")
+    embedding_max_retries: int = Field(default=5, alias="EMBEDDING_MAX_RETRIES")
+
+    # RAG
+    rag_cache_ttl_seconds: float = Field(default=300.0, alias="RAG_CACHE_TTL_SECONDS")
+    rag_cache_max_entries: int = Field(default=1000, alias="RAG_CACHE_MAX_ENTRIES")
+    rag_hybrid_enabled: bool = Field(default=True, alias="RAG_HYBRID_ENABLED")
+    rag_hybrid_candidates: int = Field(default=4, alias="RAG_HYBRID_CANDIDATES")
+    rag_rerank_enabled: bool = Field(default=True, alias="RAG_RERANK_ENABLED")
+    rag_lexical_max_documents: int = Field(default=200_000, alias="RAG_LEXICAL_MAX_DOCUMENTS")
+    rag_lexical_refresh_seconds: float = Field(default=300.0, alias="RAG_LEXICAL_REFRESH_SECONDS")
+    rag_context_max_tokens: int = Field(default=1500, alias="RAG_CONTEXT_MAX_TOKENS")
+
+    # Knowledge Ingestion
+    knowledge_chunk_size: int = Field(default=1500, alias="KNOWLEDGE_CHUNK_SIZE")
+    knowledge_chunk_overlap: int = Field(default=200, alias="KNOWLEDGE_CHUNK_OVERLAP")
+    knowledge_embed_batch_size: int = Field(default=512, alias="KNOWLEDGE_EMBED_BATCH_SIZE")
+    knowledge_upsert_page_size: int = Field(default=256, alias="KNOWLEDGE_UPSERT_PAGE_SIZE")
+    knowledge_upsert_concurrency: int = Field(default=4, alias="KNOWLEDGE_UPSERT_CONCURRENCY")
+
     # Vector Store
     vector_store_provider: str = Field(default="qdrant", alias="VECTOR_STORE_PROVIDER")
     qdrant_url: str = Field(default="http://localhost:6333", alias="QDRANT_URL")
     qdrant_api_key: Optional[str] = Field(default=None, alias="QDRANT_API_KEY")
     qdrant_collection_name: str = Field(default="coomb_knowledge", alias="QDRANT_COLLECTION_NAME")
+    qdrant_prefer_grpc: bool = Field(default=False, alias="QDRANT_PREFER_GRPC")
+    qdrant_grpc_port: int = Field(default=6334, alias="QDRANT_GRPC_PORT")
+    qdrant_timeout_seconds: float = Field(default=10.0, alias="QDRANT_TIMEOUT_SECONDS")
+    qdrant_max_connections: int = Field(default=32, alias="QDRANT_MAX_CONNECTIONS")
+    qdrant_max_retries: int = Field(default=2, alias="QDRANT_MAX_RETRIES")
+    qdrant_retry_backoff_seconds: float = Field(default=0.2, alias="QDRANT_RETRY_BACKOFF_SECONDS")
+    local_vector_store_path: str = Field(default="./storage/vectors", alias="LOCAL_VECTOR_STORE_PATH")
+    local_vector_store_flush_seconds: float = Field(
+        default=5.0, alias="LOCAL_VECTOR_STORE_FLUSH_SECONDS"
+    )
+    vector_store_hot_collections: str = Field(default="", alias="VECTOR_STORE_HOT_COLLECTIONS")
+    vector_store_hot_max_vectors: int = Field(default=50_000, alias="VECTOR_STORE_HOT_MAX_VECTORS")
+    vector_store_hot_refresh_seconds: float = Field(
+        default=300.0, alias="VECTOR_STORE_HOT_REFRESH_SECONDS"
+    )
     
     # Storage
     storage_provider: str = Field(default="local", alias="STORAGE_PROVIDER")
@@ -52,8 +90,28 @@ class Settings(BaseSettings):
     s3_secret_key: Optional[str] = Field(default=None, alias="S3_SECRET_KEY")
     s3_region: str = Field(default="us-east-1", alias="S3_REGION")
     
+    # PDF Rendering
+    pdf_render_workers: int = Field(default=2, alias="PDF_RENDER_WORKERS")
+    pdf_render_max_queue: int = Field(default=16, alias="PDF_RENDER_MAX_QUEUE")
+    pdf_render_timeout_seconds: float = Field(default=60.0, alias="PDF_RENDER_TIMEOUT_SECONDS")
+    pdf_cache_max_mb: int = Field(default=512, alias="PDF_CACHE_MAX_MB")
+    pdf_cache_max_files: int = Field(default=5000, alias="PDF_CACHE_MAX_FILES")
+    pdf_artifact_ttl_hours: float = Field(default=72.0, alias="PDF_ARTIFACT_TTL_HOURS")
+    pdf_sweep_interval_minutes: float = Field(default=30.0, alias="PDF_SWEEP_INTERVAL_MINUTES")
+
     # Cache
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    cache_backend: Literal["memory", "redis"] = Field(default="memory", alias="CACHE_BACKEND")
+    embedding_cache_max_entries: int = Field(default=10_000, alias="EMBEDDING_CACHE_MAX_ENTRIES")
+    embedding_cache_ttl_hours: float = Field(default=720.0, alias="EMBEDDING_CACHE_TTL_HOURS")
+    cache_max_entries: int = Field(default=10_000, alias="CACHE_MAX_ENTRIES")
+    pipeline_cache_ttl_hours: float = Field(default=24.0, alias="PIPELINE_CACHE_TTL_HOURS")
+    job_analysis_cache_ttl_hours: float = Field(default=168.0, alias="JOB_ANALYSIS_CACHE_TTL_HOURS")
+    translation_memory_ttl_days: float = Field(default=90.0, alias="TRANSLATION_MEMORY_TTL_DAYS")
+    translation_memory_path: str = Field(
+        default="./storage/translation_memory.db", alias="TRANSLATION_MEMORY_PATH"
+    )
     
     # Security
     api_secret_key: str = Field(default="change-me-in-production", alias="API_SECRET_KEY")
@@ -75,6 +133,11 @@ class Settings(BaseSettings):
         """Verifica se está em desenvolvimento."""
         return self.app_env == "development"
     
+    @property
+    def vector_store_hot_collections_set(self) -> set[str]:
+        """Collections espelhadas em memória na frente do Qdrant."""
+        return {c.strip() for c in self.vector_store_hot_collections.split(",") if c.strip()}
+    
     @property
     def cors_origins_list(self) -> list[str]:
         """Retorna lista de origens CORS."""
@@ -0,0 +1,251 @@
+"""Process-wide adapter instances shared by the HTTP routes."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from redis.asyncio import Redis
+
+from domain.ports.outbound.cache_port import CachePort
+from domain.ports.outbound.vector_store_port import VectorStorePort
+from application.pipelines.result_cache import PipelineResultCache
+from application.services.context_packer import ContextPacker
+from application.services.embedding_cache import EmbeddingCache
+from application.services.embedding_service import EmbeddingService
+from application.services.knowledge_ingestion_service import (
+    IngestionCheckpointStore,
+    KnowledgeIngestionService,
+)
+from application.services.lexical_index import LexicalIndex
+from application.services.rag_service import RAGService
+from application.services.retrieval_cache import RetrievalCache
+from application.services.translation_memory import TranslationMemory
+from infrastructure.adapters.outbound.cache import (
+    MemoryCacheAdapter,
+    RedisCacheAdapter,
+    SqliteCacheAdapter,
+)
+from infrastructure.adapters.outbound.pdf import WeasyPrintAdapter
+from infrastructure.adapters.outbound.pdf.artifact_sweeper import ArtifactSweeper
+from infrastructure.adapters.outbound.pdf.render_cache import PDFRenderCache
+from infrastructure.adapters.outbound.pdf.render_pool import PDFRenderPool
+from infrastructure.adapters.outbound.vector_store import (
+    LocalVectorStoreAdapter,
+    MirroredVectorStore,
+    QdrantAdapter,
+)
+from infrastructure.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+STORAGE_DIR = Path("storage")
+
+
+@lru_cache
+def get_render_pool() -> PDFRenderPool:
+    settings = get_settings()
+    return PDFRenderPool(
+        max_workers=settings.pdf_render_workers,
+        max_queue=settings.pdf_render_max_queue,
+        timeout_seconds=settings.pdf_render_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_render_cache() -> PDFRenderCache:
+    settings = get_settings()
+    STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+    return PDFRenderCache(
+        STORAGE_DIR,
+        max_bytes=settings.pdf_cache_max_mb * 1024 * 1024,
+        max_files=settings.pdf_cache_max_files,
+    )
+
+
+@lru_cache
+def get_pdf_renderer() -> WeasyPrintAdapter:
+    return WeasyPrintAdapter(
+        storage_dir=STORAGE_DIR,
+        render_pool=get_render_pool(),
+        render_cache=get_render_cache(),
+        auto_reload=get_settings().is_development,
+    )
+
+
+@lru_cache
+def get_artifact_sweeper() -> ArtifactSweeper:
+    settings = get_settings()
+    return ArtifactSweeper(
+        STORAGE_DIR,
+        max_age_seconds=settings.pdf_artifact_ttl_hours * 3600,
+        interval_seconds=settings.pdf_sweep_interval_minutes * 60,
+        render_cache=get_render_cache(),
+    )
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Cliente Redis com pool compartilhado por todos os caches."""
+    settings = get_settings()
+    return Redis.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5,
+        health_check_interval=30,
+    )
+
+
+@lru_cache
+def get_redis_cache() -> RedisCacheAdapter:
+    """CachePort sobre o Redis compartilhado (CACHE_BACKEND=redis)."""
+    return RedisCacheAdapter(get_redis())
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache:
+    settings = get_settings()
+    return EmbeddingCache(
+        max_entries=settings.embedding_cache_max_entries,
+        # Sem Redis configurado fica só o L1 em memória.
+        shared=get_redis_cache() if settings.cache_backend == "redis" else None,
+        ttl_seconds=int(settings.embedding_cache_ttl_hours * 3600),
+    )
+
+
+@lru_cache
+def get_embedding_service() -> EmbeddingService:
+    return EmbeddingService(cache=get_embedding_cache())
+
+
+@lru_cache
+def get_vector_store() -> VectorStorePort:
+    settings = get_settings()
+    dimension = get_embedding_service().dimension
+
+    if settings.vector_store_provider == "local":
+        return LocalVectorStoreAdapter(
+            Path(settings.local_vector_store_path),
+            settings.qdrant_collection_name,
+            embedding_dimension=dimension,
+            flush_interval_seconds=settings.local_vector_store_flush_seconds,
+        )
+
+    qdrant = QdrantAdapter(embedding_dimension=dimension)
+    hot_collections = settings.vector_store_hot_collections_set
+    if not hot_collections:
+        return qdrant
+
+    return MirroredVectorStore(
+        qdrant,
+        hot_collections,
+        settings.qdrant_collection_name,
+        embedding_dimension=dimension,
+        max_vectors=settings.vector_store_hot_max_vectors,
+        refresh_seconds=settings.vector_store_hot_refresh_seconds,
+    )
+
+
+@lru_cache
+def get_cache() -> CachePort:
+    settings = get_settings()
+    if settings.cache_backend == "redis":
+        return get_redis_cache()
+    return MemoryCacheAdapter(max_entries=settings.cache_max_entries)
+
+
+@lru_cache
+def get_pipeline_result_cache() -> PipelineResultCache:
+    settings = get_settings()
+    return PipelineResultCache(
+        get_cache(),
+        ttl_seconds=int(settings.pipeline_cache_ttl_hours * 3600),
+    )
+
+
+@lru_cache
+def get_translation_memory_store() -> CachePort:
+    """
+    Store próprio da memória de tradução, fora do LRU compartilhado para não
+    disputar espaço com resultados do pipeline: Redis quando configurado,
+    senão um arquivo SQLite local.
+    """
+    settings = get_settings()
+    if settings.cache_backend == "redis":
+        return get_redis_cache()
+    try:
+        return SqliteCacheAdapter(Path(settings.translation_memory_path))
+    except Exception as e:
+        logger.warning(
+            f"Translation memory store unavailable at {settings.translation_memory_path} ({e}); "
+            f"falling back to memory, translations will not survive restarts"
+        )
+        return MemoryCacheAdapter(max_entries=settings.cache_max_entries)
+
+
+@lru_cache
+def get_translation_memory() -> TranslationMemory:
+    settings = get_settings()
+    return TranslationMemory(
+        get_translation_memory_store(),
+        ttl_seconds=int(settings.translation_memory_ttl_days * 86_400),
+    )
+
+
+@lru_cache
+def get_retrieval_cache() -> RetrievalCache:
+    settings = get_settings()
+    return RetrievalCache(
+        settings.qdrant_collection_name,
+        ttl_seconds=settings.rag_cache_ttl_seconds,
+        max_entries=settings.rag_cache_max_entries,
+    )
+
+
+@lru_cache
+def get_lexical_index() -> LexicalIndex:
+    settings = get_settings()
+    return LexicalIndex(
+        get_vector_store(),
+        settings.qdrant_collection_name,
+        max_documents=settings.rag_lexical_max_documents,
+        refresh_seconds=settings.rag_lexical_refresh_seconds,
+    )
+
+
+@lru_cache
+def get_context_packer() -> ContextPacker:
+    settings = get_settings()
+    return ContextPacker(settings.openai_model, settings.rag_context_max_tokens)
+
+
+@lru_cache
+def get_rag_service() -> RAGService:
+    settings = get_settings()
+    return RAGService(
+        get_vector_store(),
+        get_embedding_service(),
+        get_retrieval_cache(),
+        lexical_index=get_lexical_index() if settings.rag_hybrid_enabled else None,
+        hybrid_candidates=settings.rag_hybrid_candidates,
+        rerank=settings.rag_rerank_enabled,
+        context_packer=get_context_packer(),
+    )
+
+
+@lru_cache
+def get_knowledge_ingestion_service() -> KnowledgeIngestionService:
+    settings = get_settings()
+    return KnowledgeIngestionService(
+        get_vector_store(),
+        get_embedding_service(),
+        get_rag_service(),
+        IngestionCheckpointStore(STORAGE_DIR / "ingestion"),
+        chunk_size=settings.knowledge_chunk_size,
+        chunk_overlap=settings.knowledge_chunk_overlap,
+        embed_batch_size=settings.knowledge_embed_batch_size,
+        upsert_page_size=settings.knowledge_upsert_page_size,
+        upsert_concurrency=settings.knowledge_upsert_concurrency,
+    )
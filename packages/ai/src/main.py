@@ -1,5 +1,6 @@
 """Coomb AI Platform - Entry Point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -24,10 +25,46 @@ async def lifespan(app: FastAPI):
 
     Path("storage").mkdir(exist_ok=True)
 
+    from infrastructure.container import (
+        get_artifact_sweeper,
+        get_cache,
+        get_context_packer,
+        get_lexical_index,
+        get_pdf_renderer,
+        get_redis,
+        get_render_pool,
+        get_translation_memory_store,
+        get_vector_store,
+    )
+    from infrastructure.adapters.inbound.http.routes.chat_routes import optimizer_service
+
+    # Instância única de CachePort para todos os serviços (rotas via container).
+    cache = get_cache()
+    if not await cache.is_healthy():
+        logger.warning(f"Cache backend '{settings.cache_backend}' is not reachable")
+
+    try:
+        await get_pdf_renderer().warm_up()
+    except Exception as e:
+        logger.warning(f"PDF renderer warm-up failed: {e}")
+
+    await get_context_packer().warm_up()
+
+    sweeper_task = asyncio.create_task(get_artifact_sweeper().run())
+
     yield
 
     logger.info("👋 Coomb AI shutting down...")
 
+    sweeper_task.cancel()
+    await optimizer_service.close()
+    get_render_pool().shutdown()
+    await get_lexical_index().close()
+    await get_vector_store().close()
+    await cache.close()
+    await get_translation_memory_store().close()
+    await get_redis().aclose()
+
 
 def create_app() -> FastAPI:
     settings = get_settings()